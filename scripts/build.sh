@@ -33,6 +33,7 @@ fi
 # Optional: clear HTTP cache
 if [[ "${CLEAR_CACHE:-0}" == "1" ]]; then
   rm -f "$REPO_ROOT/data/cache.json" || true
+  rm -rf "$REPO_ROOT/data/http_cache" || true
 fi
 
 # Debug like CI
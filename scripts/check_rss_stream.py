@@ -0,0 +1,86 @@
+# scripts/check_rss_stream.py
+#
+# fetch_rss hands bodies over FEEDS_RSS_STREAM_BYTES to the lxml streaming parser instead
+# of feedparser. This runs both on small RSS 2.0 / Atom / RSS 1.0 samples and fails if
+# they disagree on any (title, description, link, start) tuple, descriptions included
+# markup and all: a feed crossing the size threshold must not change the .ics output.
+#
+#   python scripts/check_rss_stream.py
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from sources import _rss_entries_feedparser, _rss_entries_stream  # noqa: E402
+
+FEED_URL = "https://feeds.example.org/events/feed.xml"
+
+RSS2 = b"""<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/"
+     xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:media="http://search.yahoo.com/mrss/"
+     xml:base="https://ex.com/news/">
+<channel><title>T</title><link>https://ex.com/</link>
+<item><title>Plain</title><link>https://ex.com/a</link>
+  <description>Hello &lt;b&gt;world&lt;/b&gt; &amp;amp; friends</description>
+  <pubDate>Mon, 02 Nov 2026 10:00:00 -0500</pubDate></item>
+<item><title>Encoded only</title><link>b/c</link>
+  <media:content url="https://ex.com/i.jpg"/>
+  <content:encoded><![CDATA[<p>Body <em>here</em></p>]]></content:encoded>
+  <dc:date>2026-11-03T09:00:00Z</dc:date></item>
+<item><title>Both</title><link>/abs</link><description>Short</description>
+  <content:encoded><![CDATA[<p>Long</p>]]></content:encoded></item>
+<item xml:base="https://other.org/x/"><title>Item base</title><link>rel</link></item>
+<item><title>Dirty</title><link>d</link><content:encoded><![CDATA[<p>One</p>
+  <p onclick="steal()">Two <a href="more/info" target="_blank">info</a><br>three</p>
+  <script>steal()</script><style>p { color: red }</style><img src="i.png" onerror="x()">]]></content:encoded></item>
+<item><title>Text &amp; entities</title><link>e</link><description>Kids &amp;amp; parents, 5 &amp;lt; 6</description></item>
+</channel></rss>"""
+
+ATOM = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xml:base="https://ex.com/blog/">
+<title>A</title>
+<entry><title>Summary</title><link href="post0"/><summary>Sum text</summary>
+  <updated>2026-11-01T10:00:00Z</updated></entry>
+<entry><title>Content html</title><link href="post1"/>
+  <content type="html">&lt;p&gt;Rich &amp;amp; body&lt;/p&gt;</content>
+  <published>2026-11-02T10:00:00Z</published></entry>
+<entry xml:base="sub/"><title>Nested base</title><link rel="enclosure" href="f.mp3"/>
+  <link rel="alternate" href="post2"/>
+  <content type="xhtml"><div xmlns="http://www.w3.org/1999/xhtml"><p>X <b>y</b></p></div></content></entry>
+<entry><title>Text content</title><link href="https://abs.org/p"/><content>plain content</content></entry>
+<entry><title>Html summary</title><link href="hs"/>
+  <summary type="html">&lt;p&gt;Para one&lt;/p&gt;&lt;p&gt;Para &lt;a href="two"&gt;two&lt;/a&gt;&lt;/p&gt;&lt;script&gt;x()&lt;/script&gt;</summary></entry>
+<entry><title type="text">Tom &amp; Jerry</title><link href="tj"/><summary>Cats &amp; mice &lt; dogs</summary></entry>
+</feed>"""
+
+RSS1 = b"""<?xml version="1.0"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" xmlns="http://purl.org/rss/1.0/"
+         xmlns:dc="http://purl.org/dc/elements/1.1/"
+         xmlns:content="http://purl.org/rss/1.0/modules/content/">
+<channel rdf:about="https://ex.com/"><title>R</title><link>https://ex.com/</link><description>d</description></channel>
+<item rdf:about="https://ex.com/1"><title>One</title><link>https://ex.com/1</link>
+  <description>Desc one</description><dc:date>2026-11-04T08:00:00-05:00</dc:date></item>
+<item rdf:about="https://ex.com/2"><title>Two</title><link>two</link>
+  <content:encoded><![CDATA[<p>Enc two</p>]]></content:encoded></item>
+</rdf:RDF>"""
+
+
+def main():
+    failed = 0
+    for name, body in (("rss2", RSS2), ("atom", ATOM), ("rss1", RSS1)):
+        ref = list(_rss_entries_feedparser(body, FEED_URL))
+        got = list(_rss_entries_stream(body, FEED_URL))
+        bad = [(want, have) for want, have in zip(ref, got) if want != have]
+        for want, have in bad:
+            print(f"FAIL {name}:\n  feedparser {want!r}\n  stream     {have!r}")
+        if len(ref) != len(got):
+            print(f"FAIL {name}: feedparser {len(ref)} entries, stream {len(got)}")
+            bad.append(None)
+        if not bad:
+            print(f"ok   {name}: {len(got)} entries")
+        failed += len(bad)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,7 @@ import os
 import json
 import yaml
 import fnmatch
+import functools
 import re
 import logging
 from datetime import datetime, timedelta, timezone
@@ -153,6 +154,8 @@ US_ADDR_RE = re.compile(
 )
 
 VENUE_TOKEN_RE = re.compile(r"[A-Za-z0-9&\.\-\' ]{3,}")
+# separators between a venue name and the address to its right
+VENUE_SPLIT_RE = re.compile(r"[|•\-–—,:]{1,}")
 STOP_TOKENS = {"get directions", "good to know", "highlights", "about this event",
                "tags", "organized by", "report this event", "free", "multiple dates"}
 
@@ -247,7 +250,7 @@ def _extract_venue_and_address_from_text(txt: str) -> str:
     left = plain[max(0, m.start()-160):m.start()].strip(" -•|,")
     # Split on common separators and take last clean token that isn’t a stop word
     cand = ""
-    for token in re.split(r"[|•\-–—,:]{1,}", left):
+    for token in VENUE_SPLIT_RE.split(left):
         t = token.strip()
         low = t.lower()
         if not t or low in STOP_TOKENS:
@@ -299,6 +302,10 @@ EVENTBRITE_LOC_STOP_MARKERS = [
     r"\bFree\b",
     r"\bMultiple dates\b",
 ]
+# all stop markers in one pass: the leftmost match is the earliest marker
+EVENTBRITE_LOC_STOP_RE = re.compile("|".join(EVENTBRITE_LOC_STOP_MARKERS), re.I)
+EVENTBRITE_LOC_SPLIT_RE = re.compile(r"[,\s]{2,}")
+EVENTBRITE_LOC_NOISE_RE = re.compile(r"(?:,?\s*(Get directions|Good to know|Highlights).*)$", re.I)
 
 def _extract_eventbrite_location(big: str) -> str:
     """
@@ -321,16 +328,13 @@ def _extract_eventbrite_location(big: str) -> str:
     start_idx = m.end()
 
     # Find the earliest stop marker after start
-    stop_idx = len(txt)
-    for pat in EVENTBRITE_LOC_STOP_MARKERS:
-        mm = re.search(pat, txt[start_idx:], flags=re.I)
-        if mm:
-            stop_idx = min(stop_idx, start_idx + mm.start())
+    mm = EVENTBRITE_LOC_STOP_RE.search(txt, start_idx)
+    stop_idx = mm.start() if mm else len(txt)
 
     chunk = txt[start_idx:stop_idx].strip(" -–—|")
     # De-duplicate repeated address lines like "320 Emancipation Hwy 320 Emancipation Highway ..."
     # Heuristic: collapse triple+ spaces, remove consecutive duplicate tokens.
-    parts = [p.strip() for p in re.split(r"[,\s]{2,}", chunk) if p.strip()]
+    parts = [p.strip() for p in EVENTBRITE_LOC_SPLIT_RE.split(chunk) if p.strip()]
     dedup = []
     seen = set()
     for p in parts:
@@ -342,7 +346,7 @@ def _extract_eventbrite_location(big: str) -> str:
     # Rebuild; prefer commas between likely address tokens
     loc = ", ".join(dedup)
     # Trim obvious trailing noise like ZIP repeated twice, or dangling words.
-    loc = re.sub(r"(?:,?\s*(Get directions|Good to know|Highlights).*)$", "", loc, flags=re.I).strip(", ")
+    loc = EVENTBRITE_LOC_NOISE_RE.sub("", loc).strip(", ")
     return loc
 
 
@@ -554,12 +558,18 @@ def build_cals(events, out_dir):
     log.info("Wrote calendars to %s (family=%d, adult=%d, recurring=%d, sports=%d)",
              out_dir, cat_counts["family"], cat_counts["adult"], cat_counts["recurring"], cat_counts["sports"])
 
+TIME_RANGE_RE = re.compile(r'(\d{1,2}(:\d{2})?\s*(a\.m\.|am|p\.m\.|pm))\s*[–\-to]{1,3}\s*(\d{1,2}(:\d{2})?\s*(a\.m\.|am|p\.m\.|pm))')
+TIME_SINGLE_RE = re.compile(r'\b(\d{1,2}(:\d{2})?\s*(a\.m\.|am|p\.m\.|pm)|noon|midnight)\b')
+
 def _looks_like_time_or_range(txt: str) -> bool:
     if not txt: return False
     t = txt.lower()
-    pat_range = r'(\d{1,2}(:\d{2})?\s*(a\.m\.|am|p\.m\.|pm))\s*[–\-to]{1,3}\s*(\d{1,2}(:\d{2})?\s*(a\.m\.|am|p\.m\.|pm))'
-    pat_single = r'\b(\d{1,2}(:\d{2})?\s*(a\.m\.|am|p\.m\.|pm)|noon|midnight)\b'
-    return bool(re.search(pat_range, t)) or bool(re.search(pat_single, t))
+    return bool(TIME_RANGE_RE.search(t)) or bool(TIME_SINGLE_RE.search(t))
+
+@functools.lru_cache(maxsize=None)
+def _config_regex(pat):
+    """config.yaml routing/drop patterns, compiled once per run (raises re.error if invalid)."""
+    return re.compile(pat, re.IGNORECASE)
 
 def route_to_sports(ev: dict, cfg: dict) -> bool:
     """
@@ -623,14 +633,14 @@ def route_to_sports(ev: dict, cfg: dict) -> bool:
     # ---- REGEX-BASED ROUTING (from YAML) ----
     for pat in rt.get("title_regex", []):
         try:
-            if re.search(pat, title, re.IGNORECASE):
+            if _config_regex(pat).search(title):
                 return True
         except re.error:
             pass
 
     for pat in rt.get("location_regex", []):
         try:
-            if re.search(pat, location, re.IGNORECASE):
+            if _config_regex(pat).search(location):
                 return True
         except re.error:
             pass
@@ -662,7 +672,7 @@ def is_dropped(ev: dict, cfg: dict) -> bool:
 
     for pat in drops.get("title_regex", []):
         try:
-            if re.search(pat, title, re.IGNORECASE):
+            if _config_regex(pat).search(title):
                 return True
         except re.error:
             pass
@@ -673,7 +683,7 @@ def is_dropped(ev: dict, cfg: dict) -> bool:
 
     for pat in drops.get("location_regex", []):
         try:
-            if re.search(pat, location, re.IGNORECASE):
+            if _config_regex(pat).search(location):
                 return True
         except re.error:
             pass
@@ -681,7 +691,8 @@ def is_dropped(ev: dict, cfg: dict) -> bool:
     return False
 
 def main():
-    cfg = yaml.safe_load(open('config.yaml','r',encoding='utf-8'))
+    with open('config.yaml','r',encoding='utf-8') as f:
+        cfg = yaml.safe_load(f)
     timezone = cfg.get('timezone', 'America/New_York')
     rules = cfg.get('keywords', {})
     keep_days = int(cfg.get('max_future_days', 365))
@@ -1,37 +1,533 @@
 import os
 import time
+import atexit
+import copy
 import json
 import base64
 import logging
 import re
 import hashlib
+import html
+import io
+import functools
+import threading
+import zlib
+import email.utils
 import requests
+from requests.adapters import HTTPAdapter
 import feedparser
 import urllib.parse
-from bs4 import BeautifulSoup
-from dateutil import parser
+from datetime import datetime, timezone
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve
+from dateutil import parser, tz as dttz
 from urllib.robotparser import RobotFileParser
+from concurrent.futures import ThreadPoolExecutor
+from urllib3.util.request import ACCEPT_ENCODING
 
 from utils import parse_when, jitter_sleep
 
 CACHE_PATH = "data/cache.json"
+# One small file per cached response, so a fetch never rewrites the whole cache
+HTTP_CACHE_DIR = "data/http_cache"
 
 LOG = logging.getLogger("sources")
 HTTP_LOG = logging.getLogger("sources.http")
 
+# ICS DATE / DATE-TIME values: YYYYMMDD, YYYYMMDDTHHMMSS, YYYYMMDDTHHMMSSZ
+_ICS_DT_RE = re.compile(r"^(\d{4})(\d{2})(\d{2})(?:T(\d{2})(\d{2})(\d{2}))?(Z?)$")
+
+# req_with_cache may run on worker threads; serialize the cache file read-modify-write
+_CACHE_LOCK = threading.Lock()
+# cache.json contents, loaded on first use and written back once by flush_cache()
+_CACHE = None
+_CACHE_DIRTY = False
+_HOST_SLOTS = {}
+_HOST_SLOTS_LOCK = threading.Lock()
+# (scheme, netloc, user_agent) -> (robots rules, fetched_at); see _robots_rules()
+_ROBOTS = {}
+_ROBOTS_LOCK = threading.Lock()
+# ... plus one lock per key, so concurrent first lookups for a site share a single fetch
+_ROBOTS_FETCH_LOCKS = {}
+# One keep-alive Session for every fetcher and worker thread: the adapters keep warm
+# per-host connections so repeat GETs skip the TCP/TLS handshake. Retries stay manual
+# in req_with_cache, hence max_retries=0. _host_slot caps in-flight requests per host,
+# so a per-host pool at least that large (and at least the worker count) never has
+# to discard a connection a pool worker just returned.
+_POOL_MAXSIZE = max(
+    32,
+    int(os.getenv("FEEDS_WORKERS", "8")),
+    int(os.getenv("FEEDS_HOST_CONCURRENCY", "4")),
+    int(os.getenv("EB_HOST_CONCURRENCY", "2")),
+)
+_SESSION = requests.Session()
+for _prefix in ("http://", "https://"):
+    _SESSION.mount(_prefix, HTTPAdapter(pool_connections=16, pool_maxsize=_POOL_MAXSIZE, max_retries=0))
+# urllib3 lists only the codings it can decode (br needs the brotli package)
+_SESSION.headers["Accept-Encoding"] = ACCEPT_ENCODING
+_SESSION.headers["Connection"] = "keep-alive"
+# MacKID "add to calendar" anchor: .ics href, data: calendar href, or "Apple Calendar" text
+_ICS_RX = re.compile(r"\.ics(?:$|[?#])|^data:text/calendar|apple\s+calendar", re.I)
+# ... and a loose whole-page check for it: no hit means no anchor can match _ICS_RX
+_ICS_PAGE_RX = re.compile(r"\.ics|data:text/calendar|apple", re.I)
+# Eventbrite detail parsing reads JSON-LD, metas, <time>, h1, the location/description
+# blocks (and whatever sits inside them); list pages only need the anchors
+_EB_DETAIL_STRAIN = SoupStrainer(["script", "meta", "time", "h1", "section", "div", "address", "a", "main"])
+_EB_LINK_STRAIN = SoupStrainer("a", href=True)
+# Eventbrite visible description: the tagged block is a cheap attribute match; the
+# text search has to render section/div text, so it only runs when that misses
+_SS_EB_DESC = soupsieve.compile("[data-testid='event-description'], [data-spec='event-description']")
+# ... matched case-insensitively ("About This Event" / "ABOUT THIS EVENT" both occur)
+_EB_ABOUT_RE = re.compile(r"\bAbout this event\b", re.I)
+# Eventbrite visible location block (either attribute flavour, one pass)
+_SS_EB_LOCATION = soupsieve.compile(
+    "[data-testid='event-details-location'], [data-spec='event-details-location']"
+)
+# Eventbrite detail fallbacks for fields JSON-LD left empty (compiled once, not per page)
+_SS_EB_TITLE = soupsieve.compile("h1, [data-testid='event-title'], [data-automation='listing-title']")
+_SS_EB_TIMES = soupsieve.compile("time[datetime]")
+_SS_EB_META_START = soupsieve.compile(
+    "meta[itemprop='startDate'], meta[itemprop='startdate'], meta[property='event:start_time']"
+)
+_SS_EB_META_END = soupsieve.compile(
+    "meta[itemprop='endDate'], meta[itemprop='enddate'], meta[property='event:end_time']"
+)
+_SS_EB_META_DESC = soupsieve.compile("meta[property='og:description'], meta[name='description']")
+# Whitespace runs collapsed by the text cleaners
+_WS_RE = re.compile(r"\s+")
+# Markup in JSON-LD descriptions (stripped by regex; no parser needed for a snippet)
+_TAG_RE = re.compile(r"<[^>]+>")
+# Eventbrite "About this event" boilerplate lines
+_EB_PRUNE_RE = re.compile(r"^(Share|Follow|Tags|Report this event)\b", re.I)
+# fetch_eventbrite: discovery/event HTML URLs go to the crawler, not the API
+_EB_HTML_URL_RE = re.compile(r"//[^/]*eventbrite\.com/(d/|e/)")
+# MacKID(PW) debug artifact file names
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+# Eventbrite Playwright: one event loop, driver and Chromium for the whole run, so
+# each discovery URL pays for a fresh context instead of a browser boot
+_EB_PW = {}
+# ... and the sub-resources its pages never need for link/JSON-LD scraping
+_PW_HEAVY_RE = re.compile(r"\.(?:png|jpe?g|gif|webp|avif|svg|ico|woff2?|ttf|otf|mp4|webm)(?:[?#]|$)", re.I)
+# Eventbrite listing links that look like /e/ but point at organizer/collection pages
+_EB_SKIP_RE = re.compile(r"/(?:organizer|o|collections)/")
+# fetch_html: does a candidate element mention a clock time?
+_LOOKS_TIME_RE = re.compile(r"\b\d{1,2}(:\d{2})?\s*(a\.m\.|am|p\.m\.|pm)\b")
+# Patterns that scan whole pages/card texts prefer RE2 (linear time, ASCII classes
+# by default) when installed
+try:
+    import re2 as _re2
+except Exception:
+    _re2 = None
+
+
+def _compile_linear(pattern):
+    """RE2 when available and it accepts the pattern, else stdlib re with ASCII classes."""
+    if _re2 is not None:
+        try:
+            return _re2.compile(pattern)
+        except Exception:
+            pass
+    return re.compile(pattern, re.ASCII)
+
+
+# Card fallback: "Sat, Nov 2 ... 7:00 PM" style start text
+_DATETIME_FALLBACK_PAT = (
+    r"\b(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun)?\.?,?\s*[A-Z][a-z]+\.?\s*\d{1,2}[^|,]*\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)?"
+)
+_DATETIME_FALLBACK_RE = _compile_linear(_DATETIME_FALLBACK_PAT)
+# Free Press last-resort event cards, tried in order until one matches
+_CARD_SELECTORS = (
+    "article.type-tribe_events",
+    ".tribe-events-calendar-list__event",
+    "article.calendar-item",
+    "li.event",
+    "div.event",
+    "article",
+)
+# ... matched in one tree walk; the per-selector patterns then rank what was found
+_SS_CARDS_ANY = soupsieve.compile(", ".join(_CARD_SELECTORS))
+_SS_CARD_TIERS = tuple(soupsieve.compile(sel) for sel in _CARD_SELECTORS)
+# ... and the per-card lookups, compiled once instead of per select_one() call
+_SS_A_HREF = soupsieve.compile("a[href]")
+_SS_HEADING = soupsieve.compile("h3, h2, .event-title")
+_SS_TIME = soupsieve.compile("time[datetime]")
+_SS_VENUE = soupsieve.compile(".tribe-events-calendar-list__event-venue, .event-venue, .location")
+# FXBG / Spotsy list-card fallbacks
+_SS_FXBG_CARD_DATE = soupsieve.compile(".date, .event-date, .wp-block-post-date")
+_SS_SPOTSY_CARD_TITLE = soupsieve.compile("h2, h3, .event-title, .card-title")
+_SS_SPOTSY_CARD_DATE = soupsieve.compile("time[datetime], .date, .event-date, .when")
+_SS_DESC = soupsieve.compile(
+    ".tribe-events-calendar-list__event-description, .entry-content, .event-description, p"
+)
+# Raw JSON-LD payloads straight from the page bytes (no tree); parsers are the fallback
+_JSONLD_RE = re.compile(
+    rb"<script[^>]*\btype=[\"']application/ld\+json[\"'][^>]*>(.*?)</script>", re.I | re.S
+)
+# Bot-wall / Cloudflare interstitial page titles; one alternation scan per title
+_CHALLENGE_STRINGS = ("Just a moment", "Attention Required", "Please Wait")
+_CHALLENGE_RE = re.compile("|".join(map(re.escape, _CHALLENGE_STRINGS)))
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.I | re.S)
+# ... and the in-page check Playwright polls instead of sleeping + waiting for networkidle
+_PW_CHALLENGE_CLEARED_JS = (
+    "() => !/" + "|".join(_CHALLENGE_STRINGS) + "/i.test(document.title)"
+)
+# MacKID detail pages: visible "When"/"Date" block
+_SS_WHEN_BLOCK = soupsieve.compile(
+    "section:has(h2:-soup-contains('Date')), section:has(h3:-soup-contains('When')), "
+    "div[class*=date i], div[class*=when i]"
+)
+# ... and the rest of the detail-page lookups (both MacKID paths)
+_SS_H1 = soupsieve.compile("h1")
+_SS_EVENT_TITLE = soupsieve.compile("[data-element='event-title']")
+_SS_EVENT_DESC = soupsieve.compile("[data-element='event-description'], .article-content, .event-description")
+_SS_EVENT_LOC = soupsieve.compile(
+    "[data-element='event-location'], .event-location, .location, [itemprop='location']"
+)
+_SS_EVENT_DATES = soupsieve.compile("[data-element='event-date'], .event-date, .event-time")
+_SS_META_START = soupsieve.compile("meta[itemprop='startDate'], meta[itemprop='startdate']")
+_SS_META_END = soupsieve.compile("meta[itemprop='endDate'], meta[itemprop='enddate']")
+_SS_JSONLD = soupsieve.compile('script[type="application/ld+json"]')
+# Detail parsers only look at these (plus whatever sits inside them); skip the rest of <head>
+_DETAIL_STRAIN = SoupStrainer(["h1", "a", "time", "meta", "script", "div", "section", "article", "main"])
+# MacKID event URLs (/events/<hex id>[/slug]) anywhere in the raw page bytes:
+# anchors, JSON-LD and inline JSON alike, absolute or relative. Group 1 is the URL; it
+# must start and end at a quote/space/tag (or query/fragment) so "/foo/events/<hex>" and
+# "/events/<hex>.jpg" don't match (consumed delimiters: RE2 has no lookaround)
+_MACKID_LINK_RE = _compile_linear(
+    rb"(?i)(?:^|[\"'\s=(>])((?:https?://[^\"'\s]*?)?/events/[0-9a-f]{8,}(?:/[\w\-%]*)?)(?:[\"'\s?#<>&)\\]|$)"
+)
+# ... and what a joined hit must look like to be crawled: host, then exactly the detail path
+_MACKID_DETAIL_URL_RE = re.compile(r"^https?://([^/?#]+)/events/[0-9a-f]{8,}(?:/[\w\-%]*)?$", re.I | re.A)
+# FXBG / Spotsy detail links, tested on the joined absolute URL (no urlsplit per anchor):
+# host contains fxbg.com and "/event" appears in the path ...
+_FXBG_EVENT_RE = re.compile(r"^[^:/?#]+://[^/?#]*fxbg\.com[^/?#]*/(?:[^?#]*/)?event")
+# ... host contains spotsylvaniatownecentre.com (the "/events/" test stays a substring check)
+_SPOTSY_HOST_RE = re.compile(r"^[^:/?#]+://[^/?#]*spotsylvaniatownecentre\.com")
+
+# lxml is pinned in requirements; keep html.parser as a fallback for bare installs
+try:
+    from lxml import etree as _etree
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _etree = None
+    _HTML_PARSER = "html.parser"
+
+# Optional: orjson for the larger API / JSON-LD payloads
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: ciso8601 for the (mostly ISO-8601) JSON-LD / <time datetime> values
+try:
+    from ciso8601 import parse_datetime as _iso_parse
+except ImportError:
+    _iso_parse = datetime.fromisoformat
+
+# Optional: selectolax's lexbor backend for the link-harvest helpers
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# feedparser's own URI resolver + HTML sanitizer (feedparser is pinned), so the streamed
+# RSS path returns the same description markup; without them fetch_rss never streams
+try:
+    from feedparser.sanitizer import _sanitize_html as _fp_sanitize_html
+    from feedparser.urls import resolve_relative_uris as _fp_resolve_uris
+except ImportError:
+    _fp_sanitize_html = _fp_resolve_uris = None
+
+
+def _fast_iso(s):
+    """
+    Strict ISO-8601 via ciso8601 (datetime.fromisoformat without it). Returns None
+    when `s` doesn't look like YYYY-MM-DD... so callers can fall back to dateutil.
+    """
+    if isinstance(s, str) and len(s) >= 10 and s[4] == "-" and s[7] == "-":
+        try:
+            return _iso_parse(s)
+        except ValueError:
+            return None
+    return None
+
+
+def _add_event(seen, ev):
+    """Insert `ev` into the `seen` dict keyed by (title, start, link) unless already present."""
+    seen.setdefault((ev.get("title"), ev.get("start"), ev.get("link")), ev)
+
+
+def _json_loads(s):
+    """orjson.loads when installed (str or bytes), stdlib json otherwise or if orjson balks."""
+    if orjson is not None:
+        try:
+            return orjson.loads(s)
+        except ValueError:
+            pass  # e.g. NaN/Infinity, which the stdlib parser tolerates
+    return json.loads(s)
+
+
+def _read_json(path):
+    with open(path, "rb") as f:
+        return _json_loads(f.read())
+
+
+def _write_json(path, obj):
+    """
+    Compact orjson.dumps when installed (falls back to stdlib json for values orjson refuses).
+    Written to a temp file and swapped in with os.replace, so a crash or a concurrent
+    writer never leaves a half-written file behind.
+    """
+    data = None
+    if orjson is not None:
+        try:
+            data = orjson.dumps(obj)
+        except TypeError:
+            data = None
+    if data is None:
+        data = json.dumps(obj, separators=(",", ":")).encode("utf-8")
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _html_tree(html):
+    """Parse a page once for the link helpers: a lexbor tree if selectolax is installed, else bs4."""
+    if LexborHTMLParser is not None:
+        return LexborHTMLParser(html)
+    return BeautifulSoup(html, _HTML_PARSER)
+
+
+def _page_hrefs(doc):
+    """Stripped href of every <a href> in a _html_tree() document."""
+    if LexborHTMLParser is not None and isinstance(doc, LexborHTMLParser):
+        return [(n.attributes.get("href") or "").strip() for n in doc.css("a[href]")]
+    return [(a.get("href") or "").strip() for a in doc.select("a[href]")]
+
+
+@functools.lru_cache(maxsize=4096)
+def _urljoin(base, href):
+    """urljoin memoized; MacKID list pages repeat the same event hrefs many times over."""
+    return urllib.parse.urljoin(base, href)
+
+
+def _mackid_event_links(html, page_url, cap=None):
+    """
+    Mine MacKID event detail URLs with one regex pass over the raw HTML bytes instead
+    of a DOM walk plus urljoin/urlsplit per anchor. Only detail pages on the listing's
+    own host are kept (every link costs a fetch or a Playwright navigation).
+    Stops after `cap` distinct links.
+    """
+    host = urllib.parse.urlsplit(page_url).netloc.lower()
+    links = set()
+    for m in _MACKID_LINK_RE.finditer(html.encode("utf-8")):
+        url = _urljoin(page_url, m.group(1).decode("utf-8", "replace"))
+        d = _MACKID_DETAIL_URL_RE.match(url)
+        if not d or d.group(1).lower() != host:
+            continue
+        links.add(url)
+        if cap and len(links) >= cap:
+            break
+    return links
+
+
+def _jsonld_payloads(html):
+    """JSON-LD script bodies (bytes) found by _JSONLD_RE; empty if the markup doesn't match."""
+    return [m.group(1) for m in _JSONLD_RE.finditer(html.encode("utf-8"))] if html else []
+
+
+def _iter_jsonld_texts(html, chunk_size=65536):
+    """
+    Yield the payload of each <script type="application/ld+json"> as the parser reaches
+    it. With lxml the page is fed through an HTMLPullParser in chunks and finished
+    elements are cleared, so memory stays flat and a caller that stops early never
+    parses the rest of the page (e.g. a Cloudflare challenge tail).
+    """
+    if _etree is None:
+        css = 'script[type="application/ld+json"]'
+        doc = _html_tree(html)
+        if LexborHTMLParser is not None and isinstance(doc, LexborHTMLParser):
+            yield from (n.text(deep=True) or "" for n in doc.css(css))
+        else:
+            yield from (t.string or "" for t in doc.select(css))
+        return
+
+    pp = _etree.HTMLPullParser(events=("end",), recover=True, huge_tree=False)
+
+    def _drain():
+        for _, el in pp.read_events():
+            if el.tag == "script" and el.get("type") == "application/ld+json":
+                yield el.text or ""
+            el.clear(keep_tail=True)
+
+    try:
+        for i in range(0, len(html or ""), chunk_size):
+            pp.feed(html[i:i + chunk_size])
+            yield from _drain()
+        pp.close()
+        yield from _drain()
+    except Exception as ex:
+        LOG.debug("JSON-LD stream parse stopped: %s", str(ex)[:140])
+
 
 def load_cache():
     if os.path.exists(CACHE_PATH):
         try:
-            return json.load(open(CACHE_PATH, "r", encoding="utf-8"))
+            return _read_json(CACHE_PATH)
         except Exception:
-            return {"http_cache": {}}
-    return {"http_cache": {}}
+            return {}
+    return {}
 
 
 def save_cache(cache):
     os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
-    json.dump(cache, open(CACHE_PATH, "w", encoding="utf-8"), indent=2)
+    # compact: nobody hand-edits cache.json, and indent=2 made it ~1.5x larger
+    _write_json(CACHE_PATH, cache)
+
+
+def _http_cache_path(key):
+    return os.path.join(HTTP_CACHE_DIR, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json")
+
+
+def _load_http_entry(key):
+    """Cached validators + body for one request key; {} when missing or unreadable."""
+    try:
+        return _read_json(_http_cache_path(key))
+    except Exception:
+        return {}
+
+
+def _save_http_entry(key, entry):
+    os.makedirs(HTTP_CACHE_DIR, exist_ok=True)
+    # no lock: two workers landing on the same URL each swap in a whole file
+    _write_json(_http_cache_path(key), entry)
+
+
+def _cache():
+    """The in-memory cache.json dict; callers hold _CACHE_LOCK."""
+    global _CACHE, _CACHE_DIRTY
+    if _CACHE is None:
+        _CACHE = load_cache()
+        if _prune_cache(_CACHE):
+            _CACHE_DIRTY = True  # write the smaller file back even if nothing else changes
+    return _CACHE
+
+
+def _prune_cache(cache):
+    """
+    Drop "negative" entries past their expiry and "parsed" records not rewritten within
+    FEEDS_PARSED_TTL seconds (default 30 days), so cache.json doesn't grow every run.
+    A record still in use is simply re-parsed from the HTTP cache once it ages out.
+    Also drops the old inline "http_cache" section (bodies now live in HTTP_CACHE_DIR),
+    which would otherwise be rewritten on every flush. Returns the number of entries removed.
+    """
+    now = time.time()
+    removed = 1 if cache.pop("http_cache", None) is not None else 0
+    neg = cache.get("negative") or {}
+    for k in [k for k, expires in neg.items() if expires <= now]:
+        del neg[k]
+        removed += 1
+    parsed = cache.get("parsed") or {}
+    cutoff = now - int(os.getenv("FEEDS_PARSED_TTL", str(30 * 86400)))
+    # records written before "at" existed start aging from today
+    for k in [k for k, ent in parsed.items() if ent.setdefault("at", int(now)) < cutoff]:
+        del parsed[k]
+        removed += 1
+    return removed
+
+
+def flush_cache():
+    """Write cache.json if anything changed since the last flush (also runs at exit)."""
+    global _CACHE_DIRTY
+    with _CACHE_LOCK:
+        if _CACHE is not None and _CACHE_DIRTY:
+            save_cache(_CACHE)
+            _CACHE_DIRTY = False
+
+
+atexit.register(flush_cache)
+
+
+def _pack_body(body):
+    """Cache bodies are stored zlib-compressed + base64 so the entry files stay small."""
+    raw = body if isinstance(body, bytes) else body.encode("utf-8")
+    return base64.b64encode(zlib.compress(raw, 3)).decode("ascii")
+
+
+def _cached_body(entry, want="text"):
+    """
+    The cached body as bytes (want="bytes") or str, decoded with the charset recorded
+    at fetch time. Entries without one were stored as UTF-8.
+    """
+    if "body_z" in entry:
+        try:
+            raw = zlib.decompress(base64.b64decode(entry["body_z"]))
+        except Exception:
+            raw = b""
+    else:
+        raw = entry.get("body", "").encode("utf-8")  # entries written before compression
+    return raw if want == "bytes" else _decode_body(raw, entry.get("encoding") or "utf-8")
+
+
+def _decode_body(raw, encoding):
+    # what requests' Response.text does, minus the second charset sniff
+    try:
+        return str(raw, encoding, errors="replace")
+    except (LookupError, TypeError):
+        return str(raw, errors="replace")
+
+
+def _body_sha1(body):
+    return hashlib.sha1(body if isinstance(body, bytes) else body.encode("utf-8")).hexdigest()
+
+
+def _cached_events(kind, url, body):
+    """
+    Events parsed from this exact body on an earlier run, or None. Lets feed fetchers
+    skip re-parsing when req_with_cache answers 304 with the cached body.
+    """
+    with _CACHE_LOCK:
+        ent = _cache().get("parsed", {}).get(f"{kind}||{url}")
+    if ent and ent.get("sha1") == _body_sha1(body):
+        return copy.deepcopy(ent.get("events"))  # callers normalize events in place
+    return None
+
+
+def _remember_events(kind, url, body, events):
+    """Store the events parsed from `body` for a later 304; returns `events` unchanged."""
+    if url.startswith("data:"):
+        return events
+    try:
+        # a detached copy: callers go on to mutate `events`, and the flush happens later
+        snapshot = json.loads(json.dumps(events))
+    except (TypeError, ValueError):
+        return events  # never let an odd value truncate cache.json mid-write
+    global _CACHE_DIRTY
+    with _CACHE_LOCK:
+        _cache().setdefault("parsed", {})[f"{kind}||{url}"] = {
+            "sha1": _body_sha1(body),
+            "events": snapshot,
+            "at": int(time.time()),  # see _prune_cache
+        }
+        _CACHE_DIRTY = True
+    return events
+
+
+# Known-safe feed/ICS endpoints that skip the robots.txt lookup (one alternation, one scan)
+_ALLOWLIST_RE = re.compile("|".join(map(re.escape, (
+    "/common/modules/iCalendar/iCalendar.aspx",
+    "/calendar/1.xml",
+    "/events/?ical=1",
+    "/events/feed",
+))))
 
 
 def robots_allowed(url, user_agent="*"):
@@ -44,47 +540,32 @@ def robots_allowed(url, user_agent="*"):
         LOG.debug("robots_allowed: allow data: URL")
         return True
 
-    ALLOWLIST_SUBSTR = [
-        "/common/modules/iCalendar/iCalendar.aspx",
-        "/calendar/1.xml",
-        "/events/?ical=1",
-        "/events/feed",
-    ]
-        # --- Free Press calendar embeds Google Calendar; we only extract public ICS IDs ---
-    try:
-        parts = urllib.parse.urlsplit(url)
-        if parts.netloc.endswith("fredericksburgfreepress.com") and parts.path.rstrip("/") == "/calendar":
-            LOG.debug("robots_allowed: allow FreePress /calendar (iframe contains public Google Calendar)")
-            return True
-    except Exception:
-        pass
-
     try:
-        host = urllib.parse.urlsplit(url).netloc.lower()
-        # Macaroni KID per-event ICS
-        if host.endswith("macaronikid.com") and url.lower().endswith(".ics"):
-            return True
-        # Eventbrite discovery + event pages
         parts = urllib.parse.urlsplit(url)
-        if parts.netloc.endswith("eventbrite.com") and (
-            "/d/" in parts.path or "/e/" in parts.path
-        ):
-            return True
+        host = parts.netloc.lower()
     except Exception as ex:
         LOG.debug("robots_allowed: urlsplit error (%s) → allow", str(ex))
         return True
 
-    for sub in ALLOWLIST_SUBSTR:
-        if sub in url:
-            return True
+    # --- Free Press calendar embeds Google Calendar; we only extract public ICS IDs ---
+    if host.endswith("fredericksburgfreepress.com") and parts.path.rstrip("/") == "/calendar":
+        LOG.debug("robots_allowed: allow FreePress /calendar (iframe contains public Google Calendar)")
+        return True
+    # Macaroni KID per-event ICS
+    if host.endswith("macaronikid.com") and url.lower().endswith(".ics"):
+        return True
+    # Eventbrite discovery + event pages
+    if host.endswith("eventbrite.com") and ("/d/" in parts.path or "/e/" in parts.path):
+        return True
+
+    if _ALLOWLIST_RE.search(url):
+        return True
 
     try:
-        parts = urllib.parse.urlsplit(url)
-        robots_url = f"{parts.scheme}://{parts.netloc}/robots.txt"
-        rp = RobotFileParser()
-        rp.set_url(robots_url)
-        rp.read()
-        allowed = rp.can_fetch(user_agent, url)
+        rules = _robots_rules(parts.scheme, parts.netloc, user_agent)
+        if isinstance(rules, bool):
+            return rules
+        allowed = rules.can_fetch(user_agent, url)
         if os.getenv("FEEDS_DEBUG") and not allowed:
             LOG.debug("robots.txt disallows: %s", url)
         return allowed
@@ -93,6 +574,56 @@ def robots_allowed(url, user_agent="*"):
         return True
 
 
+def _robots_rules(scheme, netloc, user_agent):
+    """
+    A site's robots.txt rules, fetched at most once per FEEDS_ROBOTS_TTL seconds (default
+    3600): a parsed RobotFileParser, or True/False when the HTTP status alone decides.
+    """
+    key = (scheme, netloc, user_agent)
+    ttl = int(os.getenv("FEEDS_ROBOTS_TTL", "3600"))
+    with _ROBOTS_LOCK:
+        hit = _ROBOTS.get(key)
+        fetch_lock = _ROBOTS_FETCH_LOCKS.setdefault(key, threading.Lock())
+    if hit and time.time() - hit[1] < ttl:
+        return hit[0]
+
+    with fetch_lock:
+        # another worker may have fetched it while we waited
+        with _ROBOTS_LOCK:
+            hit = _ROBOTS.get(key)
+        if hit and time.time() - hit[1] < ttl:
+            return hit[0]
+        return _fetch_robots_rules(key)
+
+
+def _fetch_robots_rules(key):
+    scheme, netloc, user_agent = key
+    now = time.time()
+    robots_url = f"{scheme}://{netloc}/robots.txt"
+    # Go through the HTTP cache so robots.txt gets ETag/304 + retry handling too
+    status, body, _ = req_with_cache(
+        robots_url,
+        headers={"User-Agent": user_agent} if user_agent != "*" else None,
+        throttle=(0, 0),
+        max_retries=1,
+    )
+    # Same status semantics as RobotFileParser.read()
+    if status in (401, 403):
+        rules = False
+    elif 400 <= status < 500:
+        rules = True
+    elif status not in (200, 304):
+        LOG.debug("robots_allowed: fallback allow for %s (robots.txt HTTP %s)", netloc, status)
+        rules = True
+    else:
+        rules = RobotFileParser()
+        rules.set_url(robots_url)
+        rules.parse(body.splitlines())
+    with _ROBOTS_LOCK:
+        _ROBOTS[key] = (rules, now)
+    return rules
+
+
 def _cache_key(url, headers):
     # include Authorization + User-Agent so cached bodies don't leak across creds
     h = headers or {}
@@ -101,87 +632,149 @@ def _cache_key(url, headers):
     return url + "||" + hashlib.sha1((auth + "|" + ua).encode("utf-8")).hexdigest()
 
 
-def req_with_cache(url, headers=None, throttle=(2, 5), max_retries=3):
+def _retry_after_seconds(resp):
+    """
+    Seconds requested by a Retry-After header (delta-seconds or HTTP-date), or None.
+    """
+    val = (resp.headers.get("Retry-After") or "").strip()
+    if not val:
+        return None
+    if val.isdigit():
+        return int(val)
+    try:
+        when = email.utils.parsedate_to_datetime(val)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+    except Exception:
+        return None
+
+
+def _host_limit(host):
+    """Concurrent requests allowed to `host`; Eventbrite is the touchiest about bursts."""
+    if host == "eventbrite.com" or host.endswith(".eventbrite.com"):
+        return int(os.getenv("EB_HOST_CONCURRENCY", "2"))
+    return int(os.getenv("FEEDS_HOST_CONCURRENCY", "4"))
+
+
+def _host_slot(url):
+    """Per-host semaphore; FEEDS_HOST_CONCURRENCY requests to one site at a time (default 4)."""
+    host = urllib.parse.urlsplit(url).netloc.lower()
+    with _HOST_SLOTS_LOCK:
+        sem = _HOST_SLOTS.get(host)
+        if sem is None:
+            sem = _HOST_SLOTS[host] = threading.BoundedSemaphore(max(1, _host_limit(host)))
+    return sem
+
+
+@functools.lru_cache(maxsize=1024)
+def _decode_data_url(url):
+    """
+    Payload bytes of an RFC2397 data:[<mediatype>][;base64],<data> URL, or None if malformed.
+    Cached: MacKID pages repeat the same ICS data: URLs across list and detail passes.
+    """
+    comma = url.find(",", 5)
+    if comma < 0:
+        HTTP_LOG.warning("HTTP data: malformed (no comma): %s", url[:140])
+        return None
+    meta, data_part = url[5:comma], url[comma + 1:]
+    try:
+        # percent-decoding is only needed when there is something to decode
+        raw_bytes = urllib.parse.unquote_to_bytes(data_part) if "%" in data_part else data_part.encode("utf-8")
+        return base64.b64decode(raw_bytes) if ";base64" in meta.lower() else raw_bytes
+    except Exception as ex:
+        HTTP_LOG.warning("HTTP data: decode error: %s", str(ex))
+        return None
+
+
+def req_with_cache(url, headers=None, throttle=(2, 5), max_retries=3, want="text"):
     """
     Cached GET with ETag/If-Modified-Since support, retry/backoff, and a special
     fast-path for data: URLs (e.g., MacKID per-event ICS buttons).
+    want="bytes" returns the raw body (resp.content) for callers whose parser sniffs
+    the encoding itself (feedparser, lxml), skipping requests' text decoding.
     """
+    empty = b"" if want == "bytes" else ""
     # --- Special case: data: URLs ---
     if url.startswith("data:"):
-        try:
-            meta, data_part = url.split(",", 1)
-        except ValueError:
-            HTTP_LOG.warning("HTTP data: malformed (no comma): %s", url[:140])
-            return 400, "", {}
-        # RFC2397 data:[<mediatype>][;base64],<data>
-        is_base64 = ";base64" in meta.lower()
-        try:
-            raw_bytes = urllib.parse.unquote_to_bytes(data_part)
-            body_bytes = base64.b64decode(raw_bytes) if is_base64 else raw_bytes
-            body = body_bytes.decode("utf-8", errors="replace")
-            HTTP_LOG.debug("HTTP(GET data:) %s -> 200 (len=%d)", meta[:140], len(body))
-            return 200, body, {}
-        except Exception as ex:
-            HTTP_LOG.warning("HTTP data: decode error: %s", str(ex))
-            return 400, "", {}
-
-    headers = headers or {}
-    cache = load_cache()
+        body_bytes = _decode_data_url(url)
+        if body_bytes is None:
+            return 400, empty, {}
+        body = body_bytes if want == "bytes" else body_bytes.decode("utf-8", errors="replace")
+        HTTP_LOG.debug("HTTP(GET data:) %s -> 200 (len=%d)", url[:url.find(",")][:140], len(body))
+        return 200, body, {}
+
+    # a private copy: callers reuse one headers dict across URLs, and another page's
+    # validators must never ride along on this request
+    headers = dict(headers or {})
     key = _cache_key(url, headers)
-    entry = cache["http_cache"].get(key, {})
+    entry = _load_http_entry(key)
     if "etag" in entry:
         headers["If-None-Match"] = entry["etag"]
     if "last_modified" in entry:
         headers["If-Modified-Since"] = entry["last_modified"]
 
-    session = requests.Session()
-    backoff = 1
-    for attempt in range(max_retries):
-        try:
-            HTTP_LOG.debug(
-                "HTTP GET %s | headers: UA=%r auth=%s etag=%s ims=%s",
-                url,
-                headers.get("User-Agent"),
-                "yes" if "Authorization" in headers else "no",
-                entry.get("etag"),
-                entry.get("last_modified"),
-            )
-            resp = session.get(url, headers=headers, timeout=30)
-            if resp.status_code == 304:
-                body = entry.get("body", "")
-                HTTP_LOG.debug("HTTP %s -> 304 (using cache len=%d)", url, len(body))
-                return 304, body, {}
-            if resp.status_code in (200, 201):
-                etag = resp.headers.get("ETag")
-                lastmod = resp.headers.get("Last-Modified")
-                body = resp.text
-                cache["http_cache"][key] = {
-                    "etag": etag,
-                    "last_modified": lastmod,
-                    "fetched_at": int(time.time()),
-                    "body": body[:500000],
-                }
-                save_cache(cache)
+    session = _SESSION
+    # Worker pools share this; cap in-flight requests (and their throttle sleeps) per host
+    with _host_slot(url):
+        backoff = 1
+        for attempt in range(max_retries):
+            try:
                 HTTP_LOG.debug(
-                    "HTTP %s -> %d in cache (len=%d)", url, resp.status_code, len(body)
-                )
-                jitter_sleep(throttle[0], throttle[1])
-                return resp.status_code, body, {"etag": etag, "last_modified": lastmod}
-            if resp.status_code in (429, 500, 502, 503, 504):
-                HTTP_LOG.warning(
-                    "HTTP %s -> %d (retry in %ss)", url, resp.status_code, backoff
+                    "HTTP GET %s | headers: UA=%r auth=%s etag=%s ims=%s",
+                    url,
+                    headers.get("User-Agent"),
+                    "yes" if "Authorization" in headers else "no",
+                    entry.get("etag"),
+                    entry.get("last_modified"),
                 )
+                resp = session.get(url, headers=headers, timeout=30)
+                if resp.status_code == 304:
+                    body = _cached_body(entry, want)
+                    HTTP_LOG.debug("HTTP %s -> 304 (using cache len=%d)", url, len(body))
+                    return 304, body, {}
+                if resp.status_code in (200, 201):
+                    etag = resp.headers.get("ETag")
+                    lastmod = resp.headers.get("Last-Modified")
+                    # Cache the raw bytes requests already holds (no str -> UTF-8 re-encode)
+                    # plus the charset needed to turn them back into the same text. Recorded
+                    # the same way for either `want`, so a later text caller's 304 decodes
+                    # a bytes caller's entry exactly as its own 200 would have
+                    raw = resp.content
+                    encoding = resp.encoding or resp.apparent_encoding
+                    body = raw if want == "bytes" else _decode_body(raw, encoding)
+                    _save_http_entry(
+                        key,
+                        {
+                            "url": url,
+                            "etag": etag,
+                            "last_modified": lastmod,
+                            "fetched_at": int(time.time()),
+                            "encoding": encoding,
+                            "body_z": _pack_body(raw),
+                        },
+                    )
+                    HTTP_LOG.debug(
+                        "HTTP %s -> %d in cache (len=%d)", url, resp.status_code, len(body)
+                    )
+                    jitter_sleep(throttle[0], throttle[1])
+                    return resp.status_code, body, {"etag": etag, "last_modified": lastmod}
+                if resp.status_code in (429, 500, 502, 503, 504):
+                    # Prefer the server's own Retry-After (429/503) over our guess
+                    retry_after = _retry_after_seconds(resp) if resp.status_code in (429, 503) else None
+                    wait = min(retry_after, 60) if retry_after is not None else backoff
+                    HTTP_LOG.warning(
+                        "HTTP %s -> %d (retry in %ss)", url, resp.status_code, wait
+                    )
+                    time.sleep(wait)
+                    backoff = min(backoff * 2, 30)
+                    continue
+                HTTP_LOG.debug("HTTP %s -> %d (no body cached)", url, resp.status_code)
+                return resp.status_code, empty, {}
+            except requests.RequestException as ex:
+                HTTP_LOG.warning("HTTP %s error: %s (retry in %ss)", url, str(ex), backoff)
                 time.sleep(backoff)
                 backoff = min(backoff * 2, 30)
-                continue
-            HTTP_LOG.debug("HTTP %s -> %d (no body cached)", url, resp.status_code)
-            return resp.status_code, "", {}
-        except requests.RequestException as ex:
-            HTTP_LOG.warning("HTTP %s error: %s (retry in %ss)", url, str(ex), backoff)
-            time.sleep(backoff)
-            backoff = min(backoff * 2, 30)
     HTTP_LOG.error("HTTP %s failed after %d attempts", url, max_retries)
-    return 599, "", {}
+    return 599, empty, {}
 
 
 def fetch_thrillshare_ical(events_page_url, user_agent="fxbg-event-bot/1.0"):
@@ -195,10 +788,10 @@ def fetch_thrillshare_ical(events_page_url, user_agent="fxbg-event-bot/1.0"):
     status, body, _ = req_with_cache(
         events_page_url, headers={"User-Agent": user_agent}, throttle=(1, 3)
     )
-    if status != 200 or not body:
+    if status not in (200, 304) or not body:
         return []
 
-    soup = BeautifulSoup(body, "html.parser")
+    soup = BeautifulSoup(body, _HTML_PARSER)
     a = soup.find("a", href=True, string=lambda s: s and "Download Calendar" in s)
     if not a:
         a = soup.select_one("a[href*='generate_ical']")
@@ -215,10 +808,34 @@ def fetch_thrillshare_ical(events_page_url, user_agent="fxbg-event-bot/1.0"):
 
 
 # ---------------- Eventbrite helpers & crawler ----------------
-def _eb_clean_text(s: str) -> str:
+def _eb_clean_text(s) -> str:
     if not s:
         return ""
-    return re.sub(r"\s+", " ", s).strip()
+    return _WS_RE.sub(" ", str(s)).strip()
+
+
+def _strip_tags(s) -> str:
+    lowered = s.lower()
+    if "<script" in lowered or "<style" in lowered:
+        # element *contents* must go too; leave that to a real parser
+        return BeautifulSoup(s, _HTML_PARSER).get_text(" ", strip=True)
+    return _eb_clean_text(html.unescape(_TAG_RE.sub(" ", s)))
+
+
+def _eb_to_iso(val, default_tz="America/New_York"):
+    if not val:
+        return None
+    try:
+        try:
+            # JSON-LD dates are nearly always ISO-8601; the stdlib parser is far cheaper
+            dt = datetime.fromisoformat(val)
+        except (TypeError, ValueError):
+            dt = parser.parse(val)
+        if not dt.tzinfo:
+            dt = dt.replace(tzinfo=dttz.gettz(default_tz))
+        return dt.isoformat()
+    except Exception:
+        return None
 
 
 def _eb_location_str(place):
@@ -238,57 +855,135 @@ def _eb_location_str(place):
         return ""
 
     if isinstance(place, dict):
-        typ = (place.get("@type") or place.get("type") or "").lower()
+        typ = (_eb_clean_text(place.get("@type")) or _eb_clean_text(place.get("type"))).lower()
         if "virtuallocation" in typ:
-            nm = (place.get("name") or "").strip()
+            nm = _eb_clean_text(place.get("name"))
             return "Online" if not nm else f"Online - {nm}"
 
         # Otherwise assume Place
-        name = (place.get("name") or "").strip()
+        name = _eb_clean_text(place.get("name"))
         addr_txt = ""
         addr = place.get("address")
         if isinstance(addr, dict):
             parts = [
-                (addr.get("streetAddress") or "").strip(),
-                (addr.get("addressLocality") or "").strip(),
-                (addr.get("addressRegion") or "").strip(),
-                (addr.get("postalCode") or "").strip(),
+                _eb_clean_text(addr.get("streetAddress")),
+                _eb_clean_text(addr.get("addressLocality")),
+                _eb_clean_text(addr.get("addressRegion")),
+                _eb_clean_text(addr.get("postalCode")),
             ]
             addr_txt = " ".join([p for p in parts if p])
         elif isinstance(addr, str):
-            addr_txt = addr.strip()
+            addr_txt = _eb_clean_text(addr)
 
-        if name and addr_txt:
-            return f"{name} - {addr_txt}".strip(" -")
-        return (name or addr_txt or "").strip()
+        return " - ".join([p for p in (name, addr_txt) if p]).strip(" -")
 
-    return str(place).strip()
+    return _eb_clean_text(place)
 
 
-def _parse_eventbrite_detail(detail_url, user_agent=None, default_tz="America/New_York"):
+def _past_detail_event(kind, ev_url):
     """
-    Parse a single Eventbrite event page; prefer JSON-LD @type=*Event.
-    Returns a dict with: title, description, link, start, end, location, image, source='eventbrite'
+    The event stored for this detail page if it started more than FEEDS_PAST_DETAIL_DAYS
+    (default 7) ago. Such pages are not worth even a conditional GET any more.
     """
-    import json as _json
-    from dateutil import parser as dtp, tz as dttz
+    with _CACHE_LOCK:
+        ent = _cache().get("parsed", {}).get(f"{kind}||{ev_url}")
+    events = (ent or {}).get("events") or []
+    if not events:
+        return None
+    try:
+        start = datetime.fromisoformat(events[0].get("start") or "")
+    except (TypeError, ValueError):
+        return None
+    if start.tzinfo is None:
+        return None
+    cutoff = datetime.now(timezone.utc).timestamp() - 86400 * int(os.getenv("FEEDS_PAST_DETAIL_DAYS", "7"))
+    if start.timestamp() >= cutoff:
+        return None
+    return copy.deepcopy(events[0])
 
-    def _clean(s: str) -> str:
-        if not s:
-            return ""
-        return re.sub(r"\s+", " ", str(s)).strip()
 
-    def _to_iso(val: str | None) -> str | None:
-        if not val:
-            return None
-        try:
-            dt = dtp.parse(val)
-            if not dt.tzinfo:
-                dt = dt.replace(tzinfo=dttz.gettz(default_tz))
-            return dt.isoformat()
-        except Exception:
-            return None
+def _cached_detail(kind, ev_url, headers, parse):
+    """
+    GET a detail page (conditionally, via req_with_cache) and run parse(html, ev_url) on
+    it -> event dict or None. When the page answers 304 with the body we parsed last run
+    the stored result is reused, and long-past events are returned without a request.
+    """
+    past = _past_detail_event(kind, ev_url)
+    if past is not None:
+        return past
+    neg_key = f"{kind}||{ev_url}"
+    with _CACHE_LOCK:
+        expires = _cache().get("negative", {}).get(neg_key, 0)
+    if expires > time.time():
+        return None  # 404'd or clearly wasn't an event page recently; don't ask again yet
+    st, html, _ = req_with_cache(ev_url, headers=headers, throttle=(1, 3))
+    if st not in (200, 304) or not html:
+        if st in (404, 410):
+            _remember_negative(neg_key)
+        return None
+    if st == 304:
+        cached = _cached_events(kind, ev_url, html)
+        if cached is not None:
+            return cached[0] if cached else None
+    ev = parse(html, ev_url)
+    _remember_events(kind, ev_url, html, [ev] if ev else [])
+    if ev is None:
+        if _not_an_event_page(html):
+            _remember_negative(neg_key)
+    elif expires:
+        _remember_negative(neg_key, clear=True)
+    return ev
+
+
+def _not_an_event_page(html):
+    """
+    True when a page that parsed to no event is safe to negative-cache: it carries no
+    Event JSON-LD the parser could have missed, and it isn't a bot-wall interstitial.
+    Anything else (challenge pages, a layout change) is retried on the next run.
+    """
+    m = _TITLE_RE.search(html)
+    if m and _CHALLENGE_RE.search(m.group(1)):
+        return False
+    return not any(b"Event" in p or b"Festival" in p for p in _jsonld_payloads(html))
+
+
+def _remember_negative(neg_key, clear=False):
+    """Mark a detail URL as not worth fetching for FEEDS_NEGATIVE_TTL seconds (default 7 days)."""
+    global _CACHE_DIRTY
+    with _CACHE_LOCK:
+        neg = _cache().setdefault("negative", {})
+        if clear:
+            neg.pop(neg_key, None)
+        else:
+            neg[neg_key] = time.time() + int(os.getenv("FEEDS_NEGATIVE_TTL", str(7 * 86400)))
+        _CACHE_DIRTY = True
+
 
+def _parse_eventbrite_detail(detail_url, user_agent=None, default_tz="America/New_York"):
+    """
+    Fetch a single Eventbrite event page and hand the body to _parse_eventbrite_html().
+    Returns the parsed event dict, or None if the page could not be fetched/parsed.
+    """
+    user_agent = user_agent or os.getenv("EB_UA") or (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/125.0.0.0 Safari/537.36"
+    )
+    headers = {"User-Agent": user_agent, "Accept-Language": "en-US,en;q=0.9"}
+    return _cached_detail(
+        "eventbrite_detail", detail_url, headers,
+        lambda body, u: _parse_eventbrite_html(body, u, default_tz=default_tz),
+    )
+
+
+def _extract_jsonld_event(soup, default_tz="America/New_York", blobs=None):
+    """
+    Walk every <script type="application/ld+json"> once (dict, list or @graph) and merge
+    the Event/Festival nodes into one dict with keys:
+      title, description, start, end, location, image
+    The first non-empty value per field wins. Returns None if no event node is present.
+    `blobs` (script texts already read out of a live DOM) replaces the soup lookup.
+    """
     def _is_event_type(t):
         """
         Accept any schema.org type that is an Event *or* Festival:
@@ -302,123 +997,50 @@ def _parse_eventbrite_detail(detail_url, user_agent=None, default_tz="America/Ne
         t_low = str(t).strip().lower()
         return t_low.endswith("event") or t_low == "festival"
 
-
-    def _loc_to_str(place) -> str:
-        """
-        JSON-LD 'location' may be a Place, VirtualLocation, or list.
-        Produce a compact single-line string: "Venue - street city region postal".
-        """
-        if not place:
-            return ""
-        if isinstance(place, list):
-            for p in place:
-                s = _loc_to_str(p)
-                if s:
-                    return s
-            return ""
-
-        if isinstance(place, dict):
-            typ = (_clean(place.get("@type")) or _clean(place.get("type"))).lower()
-            if "virtuallocation" in typ:
-                nm = _clean(place.get("name"))
-                return "Online" if not nm else f"Online - {nm}"
-
-            # Assume Place
-            nm = _clean(place.get("name"))
-            addr = place.get("address")
-            addr_txt = ""
-            if isinstance(addr, dict):
-                parts = [
-                    _clean(addr.get("streetAddress")),
-                    _clean(addr.get("addressLocality")),
-                    _clean(addr.get("addressRegion")),
-                    _clean(addr.get("postalCode")),
-                ]
-                addr_txt = " ".join([p for p in parts if p])
-            elif isinstance(addr, str):
-                addr_txt = _clean(addr)
-            out = " - ".join([p for p in (nm, addr_txt) if p]).strip(" -")
-            return out
-
-        return _clean(place)
-
-    def _extract_description_from_html(soup) -> str:
-        """
-        Conservative visible description fallback when JSON-LD is empty.
-        """
-        about = soup.find(
-            lambda t: t.name in ("section", "div")
-            and re.search(r"\bAbout this event\b", t.get_text(" ", strip=True), re.I)
-        ) or soup.select_one("[data-testid='event-description'], [data-spec='event-description']")
-        if about:
-            txt = about.get_text("\n", strip=True)
-            lines = [ln for ln in (txt.splitlines()) if ln.strip()]
-            pruned = []
-            for ln in lines:
-                if re.search(r"^(Share|Follow|Tags|Report this event)\b", ln, re.I):
-                    continue
-                pruned.append(ln.strip())
-            out = "\n".join(pruned).strip()
-            return out[:800].rstrip()
-
-        og = soup.select_one("meta[property='og:description'], meta[name='description']")
-        if og and og.get("content"):
-            return _clean(og["content"])[:800].rstrip()
-
-        return ""
-
-    # ---- fetch page
-    user_agent = user_agent or os.getenv("EB_UA") or (
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/125.0.0.0 Safari/537.36"
-    )
-    headers = {"User-Agent": user_agent, "Accept-Language": "en-US,en;q=0.9"}
-
-    st, body, _ = req_with_cache(detail_url, headers=headers, throttle=(1, 3))
-    if st != 200 or not body:
-        return None
-
-    soup = BeautifulSoup(body, "html.parser")
-
-    # -------- 1) Parse JSON-LD first (authoritative)
-    ev_name = desc = start = end = image_url = None
-    location_str = ""
+    found = {}
 
     def _ingest_evt(evt: dict):
-        nonlocal ev_name, desc, start, end, location_str, image_url
         if not isinstance(evt, dict):
             return
         if not _is_event_type(evt.get("@type")):
             return
 
-        nm = _clean(evt.get("name"))
-        sdt = _to_iso(evt.get("startDate") or evt.get("start_date"))
-        edt = _to_iso(evt.get("endDate") or evt.get("end_date"))
+        nm = _eb_clean_text(evt.get("name"))
+        sdt = _eb_to_iso(evt.get("startDate") or evt.get("start_date"), default_tz)
+        edt = _eb_to_iso(evt.get("endDate") or evt.get("end_date"), default_tz)
         dsc = evt.get("description")
-        loc = _loc_to_str(evt.get("location"))
+        loc = _eb_location_str(evt.get("location"))
         img = evt.get("image")
 
-        if nm and not ev_name:
-            ev_name = nm
-        if sdt and not start:
-            start = sdt
-        if edt and not end:
-            end = edt
-        if isinstance(dsc, str) and dsc and not desc:
+        if nm:
+            found.setdefault("title", nm)
+        if sdt:
+            found.setdefault("start", sdt)
+        if edt:
+            found.setdefault("end", edt)
+        if isinstance(dsc, str) and dsc and "description" not in found:
             # If JSON-LD description is HTML, strip tags to compact text.
-            desc = BeautifulSoup(dsc, "html.parser").get_text(" ", strip=True) if ("<" in dsc and ">" in dsc) else _clean(dsc)
-        if loc and not location_str:
-            location_str = _clean(loc)
+            found["description"] = _strip_tags(dsc) if ("<" in dsc and ">" in dsc) else _eb_clean_text(dsc)
+        if loc:
+            found.setdefault("location", _eb_clean_text(loc))
         # image may be string or list
         if isinstance(img, list):
             img = next((x for x in img if isinstance(x, str) and x.strip()), None)
-        if isinstance(img, str) and img and not image_url:
-            image_url = img.replace("\\u0026", "&")
-
-    for tag in soup.select('script[type="application/ld+json"]'):
+        if isinstance(img, str) and img:
+            found.setdefault("image", img.replace("\\u0026", "&"))
+
+    # Pages repeat identical blocks (breadcrumbs, organizer schema); first value wins
+    # anyway, so decode each distinct payload once, in document order.
+    if blobs is None:
+        blobs = [tag.string for tag in soup.select('script[type="application/ld+json"]')]
+    blocks = {}
+    for txt in blobs:
+        raw = (txt or "").encode("utf-8")  # orjson decodes UTF-8 bytes directly
+        blocks.setdefault(hashlib.blake2b(raw, digest_size=8).digest(), raw)
+
+    for raw in blocks.values():
         try:
-            data = _json.loads(tag.string or "")
+            data = _json_loads(raw)
         except Exception:
             continue
         if isinstance(data, dict):
@@ -429,41 +1051,92 @@ def _parse_eventbrite_detail(detail_url, user_agent=None, default_tz="America/Ne
             for node in data:
                 _ingest_evt(node)
 
+    return found or None
+
+
+def _parse_eventbrite_html(body, detail_url, default_tz="America/New_York"):
+    """
+    Parse the HTML of a single Eventbrite event page; prefer JSON-LD @type=*Event.
+    Shared by the requests crawler and the Playwright page pool.
+    Returns a dict with: title, description, link, start, end, location, image, source='eventbrite'
+    """
+    def _extract_description_from_html(soup) -> str:
+        """
+        Conservative visible description fallback when JSON-LD is empty.
+        """
+        about = _SS_EB_DESC.select_one(soup)
+        # Whole-page text first: a section/div can only match if the page does
+        if about is None and _EB_ABOUT_RE.search(soup.get_text(" ", strip=True)):
+            for t in soup.find_all(["section", "div"], limit=200):
+                if _EB_ABOUT_RE.search(t.get_text(" ", strip=True)):
+                    about = t
+                    break
+        if about:
+            txt = about.get_text("\n", strip=True)
+            lines = [ln for ln in (txt.splitlines()) if ln.strip()]
+            pruned = []
+            for ln in lines:
+                if _EB_PRUNE_RE.search(ln):
+                    continue
+                pruned.append(ln.strip())
+            out = "\n".join(pruned).strip()
+            return out[:800].rstrip()
+
+        og = _SS_EB_META_DESC.select_one(soup)
+        if og and og.get("content"):
+            return _eb_clean_text(og["content"])[:800].rstrip()
+
+        return ""
+
+    soup = BeautifulSoup(body, _HTML_PARSER, parse_only=_EB_DETAIL_STRAIN)
+
+    # -------- 1) Parse JSON-LD first (authoritative)
+    ld = _extract_jsonld_event(soup, default_tz=default_tz) or {}
+    ev_name = ld.get("title")
+    desc = ld.get("description")
+    start = ld.get("start")
+    end = ld.get("end")
+    image_url = ld.get("image")
+    location_str = ld.get("location") or ""
+
     # -------- 2) Fallbacks from visible HTML ONLY for missing fields
     if not ev_name:
-        h = soup.select_one("h1, [data-testid='event-title'], [data-automation='listing-title']")
+        h = _SS_EB_TITLE.select_one(soup)
         if h:
-            ev_name = _clean(h.get_text(" ", strip=True))
+            ev_name = _eb_clean_text(h.get_text(" ", strip=True))
 
     if not (start or end):
-        ts = [t.get("datetime") for t in soup.select("time[datetime]") if t.get("datetime")]
+        ts = [t.get("datetime") for t in _SS_EB_TIMES.select(soup) if t.get("datetime")]
         if ts:
-            start = start or _to_iso(ts[0]) or ts[0]
+            start = start or _eb_to_iso(ts[0], default_tz) or ts[0]
             if len(ts) > 1:
-                end = end or _to_iso(ts[1]) or ts[1]
+                end = end or _eb_to_iso(ts[1], default_tz) or ts[1]
         else:
-            m_start = soup.select_one("meta[itemprop='startDate'], meta[itemprop='startdate'], meta[property='event:start_time']")
-            m_end   = soup.select_one("meta[itemprop='endDate'], meta[itemprop='enddate'], meta[property='event:end_time']")
+            m_start = _SS_EB_META_START.select_one(soup)
+            m_end   = _SS_EB_META_END.select_one(soup)
             if m_start and m_start.get("content"):
-                start = _to_iso(m_start["content"]) or start
+                start = _eb_to_iso(m_start["content"], default_tz) or start
             if m_end and m_end.get("content"):
-                end = _to_iso(m_end["content"]) or end
+                end = _eb_to_iso(m_end["content"], default_tz) or end
 
     if not location_str:
-        blk = soup.select_one("[data-testid='event-details-location']") \
-              or soup.select_one("[data-spec='event-details-location']")
+        blk = _SS_EB_LOCATION.select_one(soup)
         if blk:
             addr_tag = blk.find("address")
             if addr_tag:
-                location_str = _clean(addr_tag.get_text(" ", strip=True))
+                location_str = _eb_clean_text(addr_tag.get_text(" ", strip=True))
             else:
                 lines = [ln.strip() for ln in blk.get_text("\n", strip=True).splitlines() if ln.strip()]
                 lines = lines[:3]
-                location_str = _clean(" - ".join(lines))
+                location_str = _eb_clean_text(" - ".join(lines))
 
     if not desc:
         desc = _extract_description_from_html(soup)
 
+    return _eb_event_record(ev_name, desc, start, end, location_str, image_url, detail_url)
+
+
+def _eb_event_record(ev_name, desc, start, end, location_str, image_url, detail_url):
     if location_str and len(location_str) > 300:
         location_str = ""
     if desc and len(desc) > 1500:
@@ -484,9 +1157,82 @@ def _parse_eventbrite_detail(detail_url, user_agent=None, default_tz="America/Ne
     }
 
 
+def _eventbrite_event_from_jsonld(blobs, detail_url, default_tz="America/New_York"):
+    """
+    Build the event from JSON-LD texts read straight out of the browser's DOM.
+    Returns None when a field is missing and the visible-HTML fallbacks of
+    _parse_eventbrite_html would be needed.
+    """
+    ld = _extract_jsonld_event(None, default_tz=default_tz, blobs=blobs) or {}
+    if not all(ld.get(k) for k in ("title", "start", "description", "location")):
+        return None
+    return _eb_event_record(
+        ld["title"], ld["description"], ld["start"], ld.get("end"), ld["location"], ld.get("image"), detail_url
+    )
+
+
 def fetch_eventbrite_discovery_playwright(list_url, pages=3, user_agent=None):
-    from playwright.sync_api import sync_playwright
-    import urllib.parse as _up, pathlib, time
+    """
+    Playwright fallback for Eventbrite discovery pages.
+    Collects /e/ links from the list pages, then visits the detail pages through a
+    small pool of pages that share one browser context (cookies/TLS are reused).
+    Pool size comes from EB_PW_PAGES (default 6). Chromium is launched once per run
+    and shared by later calls; each call gets its own context.
+    """
+    import asyncio
+
+    loop = _EB_PW.get("loop")
+    if loop is None:
+        loop = _EB_PW["loop"] = asyncio.new_event_loop()
+        atexit.register(_close_eb_playwright)
+    return loop.run_until_complete(
+        _eventbrite_discovery_playwright(list_url, pages=pages, user_agent=user_agent)
+    )
+
+
+async def _eb_browser():
+    """The run-wide Chromium for Eventbrite, launched on first use (or after a crash)."""
+    browser = _EB_PW.get("browser")
+    if browser is None or not browser.is_connected():
+        if "pw" not in _EB_PW:
+            from playwright.async_api import async_playwright
+
+            _EB_PW["pw"] = await async_playwright().start()
+        browser = _EB_PW["browser"] = await _EB_PW["pw"].chromium.launch(
+            headless=(os.getenv("FEEDS_PW_HEADLESS", "1") != "0"),
+            args=[
+                "--disable-blink-features=AutomationControlled",
+                "--no-sandbox",
+                "--disable-gpu",
+            ],
+        )
+    return browser
+
+
+def _close_eb_playwright():
+    loop = _EB_PW.pop("loop", None)
+    if loop is None:
+        return
+
+    async def _close():
+        if _EB_PW.get("browser") is not None:
+            await _EB_PW.pop("browser").close()
+        if _EB_PW.get("pw") is not None:
+            await _EB_PW.pop("pw").stop()
+
+    try:
+        loop.run_until_complete(_close())
+    except Exception as ex:
+        LOG.debug("EB(PW) shutdown: %s", str(ex)[:140])
+    finally:
+        loop.close()
+
+
+async def _eventbrite_discovery_playwright(list_url, pages=3, user_agent=None):
+    import asyncio
+    import urllib.parse as _up, pathlib
+
+    debug = bool(os.getenv("FEEDS_DEBUG"))
 
     sel_event_link = (
         "a[data-testid='event-card-link'], "
@@ -516,160 +1262,200 @@ def fetch_eventbrite_discovery_playwright(list_url, pages=3, user_agent=None):
     out, detail_urls = [], set()
     debug_dir = pathlib.Path("data/debug"); debug_dir.mkdir(parents=True, exist_ok=True)
 
-    with sync_playwright() as pw:
-        browser = pw.chromium.launch(
-            headless=(os.getenv("FEEDS_PW_HEADLESS", "1") != "0"),
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--no-sandbox",
-                "--disable-gpu",
-            ],
-        )
-        ctx = browser.new_context(
-            user_agent=user_agent,
-            locale="en-US",
-            timezone_id="America/New_York",
-            viewport={"width": 1366, "height": 900},
-            extra_http_headers={"Accept-Language": "en-US,en;q=0.9"},
-            java_script_enabled=True,
-            device_scale_factor=1.25,
-            is_mobile=False,
-            has_touch=False,
-            geolocation={"latitude": 38.3032, "longitude": -77.4605},
-            permissions=["geolocation"],
-            # Pretend we're on Windows – seems to help on EB infra
-            **({"platform": "Win32"} if hasattr(browser, "new_context") else {}),
-        )
+    browser = await _eb_browser()
+    ctx = await browser.new_context(
+        user_agent=user_agent,
+        locale="en-US",
+        timezone_id="America/New_York",
+        viewport={"width": 1366, "height": 900},
+        extra_http_headers={"Accept-Language": "en-US,en;q=0.9"},
+        java_script_enabled=True,
+        device_scale_factor=1.25,
+        is_mobile=False,
+        has_touch=False,
+        geolocation={"latitude": 38.3032, "longitude": -77.4605},
+        permissions=["geolocation"],
+        # Pretend we're on Windows – seems to help on EB infra
+        **({"platform": "Win32"} if hasattr(browser, "new_context") else {}),
+    )
 
-        # Simple stealth: hide webdriver, fill plugins, languages, etc.
-        ctx.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
-            Object.defineProperty(navigator, 'languages', {get: () => ['en-US','en']});
-            Object.defineProperty(navigator, 'platform', {get: () => 'Win32'});
-            Object.defineProperty(navigator, 'hardwareConcurrency', {get: () => 8});
-            Object.defineProperty(navigator, 'deviceMemory', {get: () => 8});
-            const fakePlugins = [{name:'Chrome PDF Plugin'},{name:'Chrome PDF Viewer'},{name:'Native Client'}];
-            Object.defineProperty(navigator, 'plugins', {get: () => fakePlugins});
-        """)
-
-        page = ctx.new_page()
-
-        def accept_cookies_if_present():
-            for sel in [
-                "button:has-text('Accept All')",
-                "[data-testid='cookies-banner-accept']",
-                "button:has-text('Accept all cookies')",
-                "button:has-text('I agree')",
-            ]:
-                try:
-                    b = page.locator(sel).first
-                    b.wait_for(state="visible", timeout=1200)
-                    b.click()
-                    page.wait_for_timeout(300)
-                    return
-                except Exception:
-                    continue
+    # Simple stealth: hide webdriver, fill plugins, languages, etc.
+    await ctx.add_init_script("""
+        Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+        Object.defineProperty(navigator, 'languages', {get: () => ['en-US','en']});
+        Object.defineProperty(navigator, 'platform', {get: () => 'Win32'});
+        Object.defineProperty(navigator, 'hardwareConcurrency', {get: () => 8});
+        Object.defineProperty(navigator, 'deviceMemory', {get: () => 8});
+        const fakePlugins = [{name:'Chrome PDF Plugin'},{name:'Chrome PDF Viewer'},{name:'Native Client'}];
+        Object.defineProperty(navigator, 'plugins', {get: () => fakePlugins});
+    """)
+
+    # Images, fonts and video are never read here; don't download them
+    async def _skip(route):
+        await route.abort()
+
+    await ctx.route(_PW_HEAVY_RE, _skip)
+
+    page = await ctx.new_page()
+
+    async def accept_cookies_if_present():
+        for sel in [
+            "button:has-text('Accept All')",
+            "[data-testid='cookies-banner-accept']",
+            "button:has-text('Accept all cookies')",
+            "button:has-text('I agree')",
+        ]:
+            try:
+                b = page.locator(sel).first
+                await b.wait_for(state="visible", timeout=1200)
+                await b.click()
+                await page.wait_for_timeout(300)
+                return
+            except Exception:
+                continue
 
-        def clear_bot_wall_if_present():
+    async def clear_bot_wall_if_present(pg):
+        try:
+            ttl = (await pg.title() or "").lower()
+            if any(k in ttl for k in ("just a moment", "attention required", "please wait")):
+                await pg.wait_for_function(_PW_CHALLENGE_CLEARED_JS, timeout=20000)
+        except Exception:
+            pass
+
+    async def click_show_more_if_present():
+        for sel in [
+            "button:has-text('Show more')",
+            "button:has-text('Load more')",
+            "[data-testid='search-results-show-more']",
+        ]:
             try:
-                ttl = (page.title() or "").lower()
-                if any(k in ttl for k in ("just a moment", "attention required", "please wait")):
-                    page.wait_for_timeout(6000)
-                    page.wait_for_load_state("networkidle", timeout=20000)
+                if await page.locator(sel).first.is_visible():
+                    await page.locator(sel).first.click()
+                    await page.wait_for_timeout(800)
             except Exception:
-                pass
+                continue
 
-        def click_show_more_if_present():
-            for sel in [
-                "button:has-text('Show more')",
-                "button:has-text('Load more')",
-                "[data-testid='search-results-show-more']",
-            ]:
-                try:
-                    if page.locator(sel).first.is_visible():
-                        page.locator(sel).first.click()
-                        page.wait_for_timeout(800)
-                except Exception:
-                    continue
+    async def collect_links_from_current():
+        hrefs = set()
+        for css in [
+            "a[data-testid='event-card-link']",
+            "[data-testid='search-event-card'] a[href^='/e/']",
+            "a[href^='/e/'], a[href*='/e/']",
+        ]:
+            try:
+                hrefs |= set(await page.eval_on_selector_all(
+                    css, "els => els.map(e => e.getAttribute('href') || '')"
+                ) or [])
+            except Exception:
+                pass
 
-        def collect_links_from_current():
-            hrefs = set()
-            for css in [
-                "a[data-testid='event-card-link']",
-                "[data-testid='search-event-card'] a[href^='/e/']",
-                "a[href^='/e/'], a[href*='/e/']",
-            ]:
-                try:
-                    hrefs |= set(page.eval_on_selector_all(
-                        css, "els => els.map(e => e.getAttribute('href') || '')"
-                    ) or [])
-                except Exception:
-                    pass
+        links = set()
+        for h in hrefs:
+            h = (h or "").split("?", 1)[0]
+            if not h:
+                continue
+            absu = _up.urljoin(page.url, h)
+            path = _up.urlsplit(absu).path
+            if not path.startswith("/e/") or _EB_SKIP_RE.search(path):
+                continue
+            links.add(absu)
+        return links
 
-            links = set()
-            for h in hrefs:
-                h = (h or "").split("?", 1)[0]
-                if not h:
-                    continue
-                absu = _up.urljoin(page.url, h)
-                path = _up.urlsplit(absu).path
-                if path.startswith("/e/") and not any(seg in path for seg in ("/organizer/", "/o/", "/collections/")):
-                    links.add(absu)
-            return links
+    async def load_and_scrape(url, page_num):
+        try:
+            await page.goto(url, wait_until="domcontentloaded", timeout=45000)
+            await accept_cookies_if_present()
+            await clear_bot_wall_if_present(page)
 
-        def load_and_scrape(url, page_num):
+            # Wait for something that looks like results/cards
             try:
-                page.goto(url, wait_until="domcontentloaded", timeout=45000)
-                accept_cookies_if_present()
-                clear_bot_wall_if_present()
+                await page.wait_for_selector(sel_results_root, timeout=9000)
+            except Exception:
+                pass
 
-                # Wait for something that looks like results/cards
-                try:
-                    page.wait_for_selector(sel_results_root, timeout=9000)
-                except Exception:
-                    pass
+            # Scroll to force lazy load + click any "show more"; stop once two rounds
+            # in a row bring in no new event links
+            n_prev, stable = -1, 0
+            for _ in range(18):
+                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                await page.wait_for_timeout(450)
+                await click_show_more_if_present()
+                n = await page.evaluate("document.querySelectorAll(\"a[href*='/e/']\").length")
+                stable = stable + 1 if n == n_prev else 0
+                if stable >= 2:
+                    break
+                n_prev = n
+
+            links = await collect_links_from_current()
 
-                # Scroll to force lazy load + click any "show more"
-                for _ in range(18):
-                    page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                    page.wait_for_timeout(450)
-                    click_show_more_if_present()
+            if not links:
+                # dump artifacts so you can inspect what the runner saw
+                stem = f"eb_list_p{page_num}"
+                await page.screenshot(path=str(debug_dir / f"{stem}.png"), full_page=True)
+                (debug_dir / f"{stem}.html").write_text(await page.content(), encoding="utf-8")
 
-                page.wait_for_timeout(1200)
-                links = collect_links_from_current()
+            if debug:
+                LOG.debug("   EB(PW) %s -> found %d links", url, len(links))
+            return links
+        except Exception as ex:
+            if debug:
+                LOG.debug("   EB(PW) list error on %s: %s", url, str(ex)[:160])
+            return set()
 
-                if not links:
-                    # dump artifacts so you can inspect what the runner saw
-                    stem = f"eb_list_p{page_num}"
-                    page.screenshot(path=str(debug_dir / f"{stem}.png"), full_page=True)
-                    (debug_dir / f"{stem}.html").write_text(page.content(), encoding="utf-8")
+    # 1) collect detail links across pages
+    for i in range(1, int(pages) + 1):
+        u = _with_page(list_url, i)
+        detail_urls |= await load_and_scrape(u, i)
 
-                if os.getenv("FEEDS_DEBUG"):
-                    LOG.debug("   EB(PW) %s -> found %d links", url, len(links))
-                return links
-            except Exception as ex:
-                if os.getenv("FEEDS_DEBUG"):
-                    LOG.debug("   EB(PW) list error on %s: %s", url, str(ex)[:160])
-                return set()
+    # 2) visit details through a bounded pool of pages on the same context
+    queue = asyncio.Queue()
+    for ev_url in sorted(detail_urls):
+        queue.put_nowait(ev_url)
+    parsed = {}
 
-        # 1) collect detail links across pages
-        for i in range(1, int(pages) + 1):
-            u = _with_page(list_url, i)
-            detail_urls |= load_and_scrape(u, i)
+    async def detail_worker():
+        wpage = await ctx.new_page()
+        try:
+            while True:
+                try:
+                    ev_url = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    await wpage.goto(ev_url, wait_until="domcontentloaded", timeout=45000)
+                    await clear_bot_wall_if_present(wpage)
+                    # The browser already parsed the page; read the JSON-LD out of its DOM
+                    # and only serialize + re-parse the HTML when fields are missing.
+                    blobs = await wpage.eval_on_selector_all(
+                        "script[type='application/ld+json']", "els => els.map(e => e.textContent)"
+                    )
+                    ev = _eventbrite_event_from_jsonld(blobs, ev_url)
+                    if ev is None:
+                        ev = _parse_eventbrite_html(await wpage.content(), ev_url)
+                    parsed[ev_url] = ev
+                except Exception as ex:
+                    if debug:
+                        LOG.debug("   EB(PW) detail error on %s: %s", ev_url, str(ex)[:160])
+        finally:
+            await wpage.close()
+
+    n_workers = min(max(1, int(os.getenv("EB_PW_PAGES", "6"))), len(detail_urls))
+    if n_workers:
+        await asyncio.gather(*(detail_worker() for _ in range(n_workers)))
 
-        # 2) visit each detail
-        for ev_url in sorted(detail_urls):
-            ev = _parse_eventbrite_detail(ev_url, user_agent=user_agent)
-            if ev:
-                out.append(ev)
-            elif os.getenv("FEEDS_DEBUG"):
-                LOG.debug("   · EB(PW) skipped (parse failed): %s", ev_url)
+    for ev_url in sorted(detail_urls):
+        ev = parsed.get(ev_url)
+        if ev:
+            out.append(ev)
+        elif debug:
+            LOG.debug("   · EB(PW) skipped (parse failed): %s", ev_url)
 
-        ctx.close(); browser.close()
+    await ctx.close()
 
     return out
 
 def fetch_eventbrite_discovery(list_url, pages=3, user_agent="fxbg-event-bot/1.0"):
+    debug = bool(os.getenv("FEEDS_DEBUG"))
     if not robots_allowed(list_url, user_agent):
         return []
 
@@ -694,45 +1480,52 @@ def fetch_eventbrite_discovery(list_url, pages=3, user_agent="fxbg-event-bot/1.0
         "Upgrade-Insecure-Requests": "1",
     }
 
-    detail_urls, pages_seen = set(), 0
+    # dict as an insertion-ordered set: detail pages are fetched in discovery order
+    detail_urls, pages_seen = {}, 0
 
     for i in range(1, int(pages) + 1):
         u = _with_page(list_url, i)
         st, body, _ = req_with_cache(u, headers=headers, throttle=(1, 3))
-        if os.getenv("FEEDS_DEBUG"):
+        if debug:
             LOG.debug("   Eventbrite page %d: HTTP %s", i, st)
 
         # Fast exit to Playwright if page 1 is blocked
-        if i == 1 and st != 200:
-            if os.getenv("FEEDS_DEBUG"):
+        if i == 1 and st not in (200, 304):
+            if debug:
                 LOG.debug("   Eventbrite HTML got %s on page 1 → using Playwright", st)
             return fetch_eventbrite_discovery_playwright(list_url, pages=pages, user_agent=ua)
 
-        if st != 200 or not body:
+        if st not in (200, 304) or not body:
             continue
 
         pages_seen += 1
-        soup = BeautifulSoup(body, "html.parser")
+        soup = BeautifulSoup(body, _HTML_PARSER, parse_only=_EB_LINK_STRAIN)
         for a in soup.select("a[href*='/e/']"):
             href = (a.get("href") or "").split("?", 1)[0]
             if not href:
                 continue
             absu = urllib.parse.urljoin(u, href)
             path = urllib.parse.urlsplit(absu).path
-            if path.startswith("/e/") and not any(seg in path for seg in ("/organizer/", "/o/", "/collections/")):
-                detail_urls.add(absu)
+            if not path.startswith("/e/") or _EB_SKIP_RE.search(path):
+                continue
+            detail_urls[absu] = None
 
     if not detail_urls:
-        if os.getenv("FEEDS_DEBUG"):
+        if debug:
             LOG.debug("   Eventbrite (HTML) blocked or empty → falling back to Playwright")
         return fetch_eventbrite_discovery_playwright(list_url, pages=pages, user_agent=ua)
 
+    # Detail pages are independent blocking GETs; fan them out over a small pool
+    urls = list(detail_urls)
+    workers = max(1, int(os.getenv("EB_WORKERS", "8")))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        results = list(ex.map(lambda u: _parse_eventbrite_detail(u, user_agent=ua), urls))
+
     out = []
-    for ev_url in sorted(detail_urls):
-        ev = _parse_eventbrite_detail(ev_url, user_agent=ua)
+    for ev_url, ev in zip(urls, results):
         if ev:
             out.append(ev)
-        elif os.getenv("FEEDS_DEBUG"):
+        elif debug:
             LOG.debug("   · Eventbrite skipped (parse failed): %s", ev_url)
     return out
 
@@ -740,47 +1533,216 @@ def fetch_eventbrite_discovery(list_url, pages=3, user_agent="fxbg-event-bot/1.0
 def fetch_rss(url, user_agent="fxbg-event-bot/1.0"):
     if not robots_allowed(url, user_agent):
         return []
-    status, body, _ = req_with_cache(url, headers={"User-Agent": user_agent})
+    # feedparser sniffs the encoding from the XML prolog itself; hand it bytes
+    status, body, _ = req_with_cache(url, headers={"User-Agent": user_agent}, want="bytes")
     if status == 304:
-        LOG.debug("RSS %s -> 304 (no changes)", url)
-        return []
-    if status != 200 or not body:
+        cached = _cached_events("rss", url, body)
+        if cached is not None:
+            LOG.debug("RSS %s -> 304 (reusing %d parsed events)", url, len(cached))
+            return cached
+    if status not in (200, 304) or not body:
         LOG.debug("RSS %s -> %s (no body)", url, status)
         return []
-    feed = feedparser.parse(body)
+    entries = None
+    if (
+        _etree is not None
+        and _fp_sanitize_html is not None
+        and len(body) > int(os.getenv("FEEDS_RSS_STREAM_BYTES", str(256 * 1024)))
+    ):
+        try:
+            entries = list(_rss_entries_stream(body, url))
+        except Exception as ex:  # not well-formed: feedparser copes with that
+            LOG.debug("RSS %s stream parse failed (%s); using feedparser", url, str(ex)[:140])
+    if entries is None:
+        entries = _rss_entries_feedparser(body, url)
     events = []
-    for e in feed.entries:
-        title = getattr(e, "title", "").strip()
-        desc = getattr(e, "summary", "") or getattr(e, "description", "")
-        link = getattr(e, "link", "")
+    for title, desc, link, dt in entries:
+        events.append(
+            {
+                "title": title,
+                "description": desc,
+                "link": link,
+                "start": dt.isoformat() if dt else None,
+                "end": None,
+                "location": None,
+                "source": url,
+            }
+        )
+    LOG.debug("RSS %s -> %d events", url, len(events))
+    return _remember_events("rss", url, body, events)
+
+
+def _rss_entries_feedparser(body, url=None):
+    """
+    (title, description, link, start datetime) per entry, via feedparser. Relative links
+    resolve against xml:base, else the feed URL (feedparser's Content-Location base).
+    """
+    headers = {"content-location": url} if url else None
+    for e in feedparser.parse(body, response_headers=headers).entries:
+        # FeedParserDict.get goes straight to the (keymap-aware) item lookup; the
+        # attribute protocol only forwards there after a failed __getattribute__
+        title = (e.get("title") or "").strip()
+        desc = e.get("summary") or e.get("description") or ""
+        link = e.get("link") or ""
         dt = None
-        for k in ["start_time", "published", "updated", "created"]:
-            if hasattr(e, k):
-                try:
-                    dt = parser.parse(getattr(e, k))
+        for k in _FEED_DT_KEYS:
+            v = e.get(k)
+            if v:
+                dt = _feed_dt(v)
+                if dt:
+                    break
+        yield title, desc, link, dt
+
+
+def _rss_entries_stream(body, url=None):
+    """
+    _rss_entries_feedparser's tuples, streamed with lxml.iterparse for big feeds: each
+    <item>/<entry> is read and then dropped, so memory stays flat. Like feedparser, the
+    description falls back to <content>/<content:encoded> (see _stream_description) and
+    links resolve against the inherited xml:base, then the feed URL.
+    Raises on malformed XML (the caller falls back to feedparser).
+    """
+    ctx = _etree.iterparse(
+        io.BytesIO(body), events=("end",), tag=("{*}item", "{*}entry"), resolve_entities=False, no_network=True
+    )
+    for _, el in ctx:
+        fields = {}
+        desc_nodes = {}
+        link = ""
+        for child in el:
+            if not isinstance(child.tag, str):
+                continue  # comments / processing instructions
+            name = _etree.QName(child).localname
+            if name == "link":
+                # RSS: <link>url</link>; Atom: <link rel="alternate" href="url"/>
+                if not link and child.get("rel", "alternate") == "alternate":
+                    link = (child.get("href") or child.text or "").strip()
+                    if link:
+                        # .base is the xml:base in scope (None when there is none)
+                        link = urllib.parse.urljoin(urllib.parse.urljoin(url or "", child.base or ""), link)
+                continue
+            if name not in fields:
+                # first non-empty one: an empty <media:content/> mustn't shadow Atom's <content>
+                text = "".join(child.itertext())
+                if text.strip():
+                    fields[name] = text
+                    if name in _STREAM_DESC_FIELDS:
+                        desc_nodes[name] = child
+        dt = None
+        for key in _STREAM_DT_FIELDS:
+            v = fields.get(key)
+            if v:
+                dt = _feed_dt(v.strip())
+                if dt:
                     break
-                except Exception:
-                    pass
-        events.append(
-            {
-                "title": title,
-                "description": desc,
-                "link": link,
-                "start": dt.isoformat() if dt else None,
-                "end": None,
-                "location": None,
-                "source": url,
-            }
+        desc = ""
+        for key in _STREAM_DESC_FIELDS:
+            if key in desc_nodes:
+                desc = _stream_description(desc_nodes[key], url)
+                break
+        yield (fields.get("title") or "").strip(), desc, link, dt
+        el.clear()
+        while el.getprevious() is not None:
+            del el.getparent()[0]
+
+
+def _stream_description(node, url):
+    """
+    A description element as feedparser returns it. RSS bodies and Atom type="html" /
+    "xhtml" are markup: relative URIs are resolved against the element's xml:base (then
+    the feed URL) and the result goes through feedparser's sanitizer, so scripts, styles
+    and on* handlers are dropped while the paragraphs main.py keeps survive. Atom text
+    comes back as-is.
+    """
+    kind = node.get("type", "text").lower() if _etree.QName(node).namespace in _ATOM_NS else "html"
+    if kind in ("xhtml", "application/xhtml+xml"):
+        # inline XHTML: serialize what's inside the wrapping <div>, minus the namespace
+        inner = node
+        kids = [c for c in node if isinstance(c.tag, str)]
+        if (
+            len(kids) == 1 and _etree.QName(kids[0]).localname == "div"
+            and not (node.text or "").strip() and not (kids[0].tail or "").strip()
+        ):
+            inner = kids[0]
+        for e in inner.iter():
+            if isinstance(e.tag, str):
+                e.tag = _etree.QName(e).localname
+        _etree.cleanup_namespaces(inner)
+        out = html.escape(inner.text or "", quote=False) + "".join(
+            _etree.tostring(c, encoding="unicode", with_tail=True) for c in inner
         )
-    LOG.debug("RSS %s -> %d events", url, len(events))
-    return events
+        mime = "application/xhtml+xml"
+    elif kind in ("html", "text/html"):
+        out = "".join(node.itertext())
+        mime = "text/html"
+    else:
+        return "".join(node.itertext()).strip()
+    out = out.strip()
+    if not out:
+        return ""
+    base = urllib.parse.urljoin(url or "", node.base or "")
+    if base:
+        out = _fp_resolve_uris(out, base, "utf-8", mime)
+    return _fp_sanitize_html(out, "utf-8", mime)
+
+
+# Atom 1.0 / 0.3 namespaces; anything else (RSS 0.9x/1.0/2.0) carries HTML descriptions
+_ATOM_NS = ("http://www.w3.org/2005/Atom", "http://purl.org/atom/ns#")
+# Description elements in feedparser's order: summary/description, then the full body
+_STREAM_DESC_FIELDS = ("summary", "description", "content", "encoded")
+# RSS/Atom entry keys tried for the event date, most specific first
+_FEED_DT_KEYS = ("start_time", "published", "updated", "created")
+# ... and the raw element names feedparser maps onto them (pubDate/issued -> published,
+# modified/dc:date -> updated, dcterms:created -> created)
+_STREAM_DT_FIELDS = ("pubDate", "published", "issued", "updated", "modified", "date", "created")
+
+
+def _feed_dt(val):
+    """
+    RSS/Atom entry dates: ISO-8601 (Atom) or RFC-822 (RSS) nearly always, so try
+    those parsers before dateutil's generic one. None if nothing can read it.
+    """
+    dt = _fast_iso(val)
+    if dt:
+        return dt
+    if isinstance(val, str) and val[:3].isalpha() and "," in val[:5]:
+        try:
+            dt = email.utils.parsedate_to_datetime(val)
+        except (TypeError, ValueError):
+            dt = None
+        if dt and dt.tzinfo:  # "-0000" comes back naive; let dateutil decide those
+            return dt
+    try:
+        return parser.parse(val)
+    except Exception:
+        return None
+
+
+def _ics_vevent_blocks(text):
+    """
+    Yield the text between each BEGIN:VEVENT and its END:VEVENT (or the next BEGIN:VEVENT
+    / end of text when END is missing), one slice at a time instead of materializing
+    body.split("BEGIN:VEVENT") for the whole feed.
+    """
+    pos = text.find("BEGIN:VEVENT")
+    while pos >= 0:
+        start = pos + len("BEGIN:VEVENT")
+        nxt = text.find("BEGIN:VEVENT", start)
+        limit = nxt if nxt >= 0 else len(text)
+        end = text.find("END:VEVENT", start, limit)
+        yield text[start:end if end >= 0 else limit]
+        pos = nxt
 
 
 def fetch_ics(url, user_agent="fxbg-event-bot/1.0"):
     if not robots_allowed(url, user_agent):
         return []
     status, body, _ = req_with_cache(url, headers={"User-Agent": user_agent})
-    if status == 304 or status != 200 or not body:
+    if status == 304:
+        cached = _cached_events("ics", url, body)
+        if cached is not None:
+            return cached
+    if status not in (200, 304) or not body:
         return []
 
     def ics_unescape(s: str) -> str:
@@ -795,41 +1757,44 @@ def fetch_ics(url, user_agent="fxbg-event-bot/1.0"):
     def parse_ics_dt(s):
         if not s:
             return None
+        m = _ICS_DT_RE.match(s.strip())
+        if m:
+            y, mo, d, hh, mi, ss, z = m.groups()
+            try:
+                return datetime(int(y), int(mo), int(d), int(hh or 0), int(mi or 0), int(ss or 0),
+                                tzinfo=timezone.utc if z else None)
+            except ValueError:
+                return None
         s = s.replace("Z", "")
         try:
             return parser.parse(s)
         except Exception:
             return None
 
-    events = []
-    chunks = body.split("BEGIN:VEVENT")
-    for chunk in chunks[1:]:
-        block = chunk.split("END:VEVENT")[0]
-
-        # Unfold lines: continuation lines start with space or tab
-        raw_lines = block.splitlines()
-        unfolded = []
-        for ln in raw_lines:
-            if ln.startswith((" ", "\t")) and unfolded:
-                unfolded[-1] += ln[1:]
-            else:
-                unfolded.append(ln.rstrip("\r"))
-        lines = [ln for ln in unfolded if ln.strip()]
-
-        def get_prop(name: str):
-            name_u = name.upper()
-            for ln in lines:
-                L = ln.upper()
-                if L.startswith(name_u + ":") or L.startswith(name_u + ";"):
-                    return ln.split(":", 1)[1]
-            return None
+    # Unfold the whole body up front (RFC 5545 3.1: a line break followed by one space
+    # or tab is a continuation), bare-LF and bare-CR feeds included
+    unfolded = (
+        body.replace("\r\n ", "").replace("\r\n\t", "")
+        .replace("\n ", "").replace("\n\t", "")
+        .replace("\r ", "").replace("\r\t", "")
+    )
 
-        title = get_prop("SUMMARY")
-        loc = get_prop("LOCATION")
-        dtstart = get_prop("DTSTART")
-        dtend = get_prop("DTEND")
-        desc = get_prop("DESCRIPTION")
-        url_prop = get_prop("URL")
+    events = []
+    for block in _ics_vevent_blocks(unfolded):
+
+        # One pass: NAME[;params]:value -> props[NAME]; the first occurrence wins
+        props = {}
+        for ln in block.splitlines():
+            k, sep, v = ln.partition(":")
+            if sep:
+                props.setdefault(k.split(";", 1)[0].upper(), v)
+
+        title = props.get("SUMMARY")
+        loc = props.get("LOCATION")
+        dtstart = props.get("DTSTART")
+        dtend = props.get("DTEND")
+        desc = props.get("DESCRIPTION")
+        url_prop = props.get("URL")
 
         if title:
             title = ics_unescape(title.strip())
@@ -860,46 +1825,31 @@ def fetch_ics(url, user_agent="fxbg-event-bot/1.0"):
             }
         )
 
-    return events
+    return _remember_events("ics", url, body, events)
 
 
 # ---------- Fredericksburg Free Press scraper ----------
-from dateutil import parser as dtparse, tz as dttz
-
+from dateutil import parser as dtparse
 
 def _clean_text(s: str) -> str:
     if not s:
         return ""
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
+    # str.split() breaks on exactly the characters \s matches and drops the ends, so
+    # this is _WS_RE.sub(" ", s).strip() in two C calls with no regex engine
+    return " ".join(s.split())
 
 def _parse_dt(val, default_tz="America/New_York"):
-    if not val:
-        return None
-    try:
-        dt = dtparse.parse(val)
-        if not dt.tzinfo:
-            dt = dt.replace(tzinfo=dttz.gettz(default_tz))
-        return dt
-    except Exception:
+    # dateutil only takes strings; bail before its (slow) exception path on blanks
+    if not isinstance(val, str) or not val.strip():
         return None
+    return _parse_dt_cached(val, default_tz)
 
 
-# ---------- Fredericksburg Free Press scraper ----------
-from dateutil import parser as dtparse, tz as dttz
-
-def _clean_text(s: str) -> str:
-    if not s:
-        return ""
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-def _parse_dt(val, default_tz="America/New_York"):
-    if not val:
-        return None
+@functools.lru_cache(maxsize=4096)
+def _parse_dt_cached(val, default_tz):
+    """Date strings repeat a lot across one site's pages; datetimes are immutable."""
     try:
-        dt = dtparse.parse(val)
+        dt = _fast_iso(val) or dtparse.parse(val)
         if not dt.tzinfo:
             dt = dt.replace(tzinfo=dttz.gettz(default_tz))
         return dt
@@ -940,6 +1890,24 @@ def _google_calendar_ics_url(calendar_id: str) -> str:
     """
     return f"https://calendar.google.com/calendar/ical/{calendar_id}/public/basic.ics"
 
+
+def _event_jsonld_payloads(soup):
+    """
+    Distinct ld+json script bodies that can hold an Event/Festival node, in document
+    order. SEO plugins often repeat the inline block, and breadcrumb/organization
+    blocks never match, so neither is worth a JSON decode.
+    """
+    seen = set()
+    for tag in _SS_JSONLD.select(soup):
+        payload = tag.string or ""
+        if '"Event"' not in payload and '"Festival"' not in payload:
+            continue
+        if payload in seen:
+            continue
+        seen.add(payload)
+        yield payload
+
+
 def fetch_freepress_calendar(url: str, default_tz="America/New_York"):
     """
     Scrape https://www.fredericksburgfreepress.com/calendar/ for events.
@@ -951,6 +1919,7 @@ def fetch_freepress_calendar(url: str, default_tz="America/New_York"):
 
     Returns list of dicts with keys: title, description, location, start, end, link, source
     """
+    debug = bool(os.getenv("FEEDS_DEBUG"))
     headers = {"User-Agent": "fxbg-event-feeds/1.0 (+github.com/caymran/fxbg-event-feeds)"}
 
     if not robots_allowed(url, headers.get("User-Agent", "*")):
@@ -958,19 +1927,23 @@ def fetch_freepress_calendar(url: str, default_tz="America/New_York"):
 
     status, body, _ = req_with_cache(url, headers=headers, throttle=(2, 5))
     if status == 304:
-        return []
-    if status != 200 or not body:
-        if os.getenv("FEEDS_DEBUG"):
+        cached = _cached_events("freepress", url, body)
+        if cached is not None:
+            return cached
+    if status not in (200, 304) or not body:
+        if debug:
             LOG.debug("   FreePress HTTP %s", status)
         return []
 
-    soup = BeautifulSoup(body, "html.parser")
-    out = []
+    soup = BeautifulSoup(body, _HTML_PARSER)
+    out = {}  # (title, start, link) -> event, first one wins
+    # One lowered copy of the page gates the tree walks below that would find nothing
+    body_low = body.lower()
 
     # ---------- 1) JSON-LD Events (as before) ----------
-    for tag in soup.select('script[type="application/ld+json"]'):
+    for payload in (_event_jsonld_payloads(soup) if "ld+json" in body_low else ()):
         try:
-            data = json.loads(tag.string or "")
+            data = _json_loads(payload)
         except Exception:
             continue
 
@@ -1005,7 +1978,8 @@ def fetch_freepress_calendar(url: str, default_tz="America/New_York"):
             else:
                 location = _clean_text(str(loc_block))
 
-            out.append(
+            _add_event(
+                out,
                 {
                     "title": name,
                     "description": desc,
@@ -1030,12 +2004,16 @@ def fetch_freepress_calendar(url: str, default_tz="America/New_York"):
                     emit(node)
 
     if out:
-        return out
+        return _remember_events("freepress", url, body, list(out.values()))
 
     # ---------- 2) Microdata Events (as before) ----------
-    for ev in soup.select(
-        '[itemscope][itemtype*="schema.org/Event"], [itemscope][itemtype*="schema.org/event"]'
-    ):
+    # Most pages carry no microdata at all; skip the full-tree selector walk then.
+    micro = []
+    if "schema.org/event" in body_low:
+        micro = soup.select(
+            '[itemscope][itemtype*="schema.org/Event"], [itemscope][itemtype*="schema.org/event"]'
+        )
+    for ev in micro:
         def gp(prop):
             el = ev.select_one(f'[itemprop="{prop}"]')
             if not el:
@@ -1062,7 +2040,8 @@ def fetch_freepress_calendar(url: str, default_tz="America/New_York"):
         href = link_el["href"] if link_el and link_el.has_attr("href") else url
 
         if title:
-            out.append(
+            _add_event(
+                out,
                 {
                     "title": title,
                     "description": desc,
@@ -1075,10 +2054,10 @@ def fetch_freepress_calendar(url: str, default_tz="America/New_York"):
             )
 
     if out:
-        return out
+        return _remember_events("freepress", url, body, list(out.values()))
 
     # ---------- 3) Google Calendar <iframe> fallback ----------
-    cal_ids = _google_iframe_calendar_ids(soup)
+    cal_ids = _google_iframe_calendar_ids(soup) if "<iframe" in body_low else []
     if cal_ids:
         ebundle = []
         for cid in cal_ids:
@@ -1093,43 +2072,39 @@ def fetch_freepress_calendar(url: str, default_tz="America/New_York"):
                 e.setdefault("link", url)
             ebundle.extend(evs)
         if ebundle:
-            if os.getenv("FEEDS_DEBUG"):
+            if debug:
                 LOG.debug("   FreePress GCal iframe -> %d events from %d calendars", len(ebundle), len(cal_ids))
             return ebundle
 
     # ---------- 4) LAST RESORT: loose event-card patterns (as before) ----------
-    candidates = soup.select(
-        "article.type-tribe_events, "
-        ".tribe-events-calendar-list__event, "
-        "article.calendar-item, "
-        "li.event, "
-        "div.event, "
-        "article"
-    )
+    # Most specific first; bare <article> only when nothing better matched.
+    candidates = []
+    matched = _SS_CARDS_ANY.select(soup)
+    for tier in _SS_CARD_TIERS if matched else ():
+        candidates = [n for n in matched if tier.match(n)]
+        if candidates:
+            break
     for node in candidates:
-        a = node.select_one("a[href]")
+        a = _SS_A_HREF.select_one(node)
         title = ""
         href = url
         if a:
             title = _clean_text(a.get_text(" ", strip=True))
             href = a.get("href") or href
         if not title:
-            h = node.select_one("h3, h2, .event-title")
+            h = _SS_HEADING.select_one(node)
             if h:
                 title = _clean_text(h.get_text(" ", strip=True))
         start_txt = None
         end_txt = None
-        tstarts = node.select("time[datetime]")
+        tstarts = _SS_TIME.select(node)
         if tstarts:
             start_txt = tstarts[0].get("datetime")
             if len(tstarts) > 1:
                 end_txt = tstarts[1].get("datetime")
         if not start_txt:
             dt_guess = node.get_text(" ", strip=True)
-            m = re.search(
-                r"\b(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun)?\.?,?\s*[A-Z][a-z]+\.?\s*\d{1,2}[^|,]*\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)?",
-                dt_guess,
-            )
+            m = _DATETIME_FALLBACK_RE.search(dt_guess)
             if m:
                 start_txt = m.group(0)
 
@@ -1137,19 +2112,16 @@ def fetch_freepress_calendar(url: str, default_tz="America/New_York"):
         end = _parse_dt(end_txt, default_tz)
 
         loc = ""
-        loc_el = node.select_one(
-            ".tribe-events-calendar-list__event-venue, .event-venue, .location"
-        )
+        loc_el = _SS_VENUE.select_one(node)
         if loc_el:
             loc = _clean_text(loc_el.get_text(" ", strip=True))
 
-        desc_el = node.select_one(
-            ".tribe-events-calendar-list__event-description, .entry-content, .event-description, p"
-        )
+        desc_el = _SS_DESC.select_one(node)
         desc = _clean_text(desc_el.get_text(" ", strip=True)) if desc_el else ""
 
         if title and start:
-            out.append(
+            _add_event(
+                out,
                 {
                     "title": title,
                     "description": desc,
@@ -1161,7 +2133,7 @@ def fetch_freepress_calendar(url: str, default_tz="America/New_York"):
                 }
             )
 
-    return out
+    return _remember_events("freepress", url, body, list(out.values()))
 
 
 # ---------- FXBG (fxbg.com/events) ----------
@@ -1176,32 +2148,32 @@ def fetch_fxbg_events(url: str, default_tz="America/New_York", user_agent="fxbg-
         return []
 
     status, body, _ = req_with_cache(url, headers={"User-Agent": user_agent}, throttle=(2, 5))
-    if status != 200 or not body:
+    if status not in (200, 304) or not body:
         return []
 
-    soup = BeautifulSoup(body, "html.parser")
+    # Link harvest on the cheap tree; bs4 is only needed if the card fallback runs
+    doc = _html_tree(body)
     out = []
 
     # Find event cards/links
-    detail_links = set()
-    for a in soup.select("a[href]"):
-        href = (a.get("href") or "").strip()
+    detail_links = {}  # insertion-ordered set: discovery order, no sort needed
+    for href in _page_hrefs(doc):
         if not href:
             continue
-        absu = urllib.parse.urljoin(url, href)
-        if "fxbg.com" in urllib.parse.urlsplit(absu).netloc and "/event" in urllib.parse.urlsplit(absu).path:
-            detail_links.add(absu)
+        absu = _urljoin(url, href)
+        if _FXBG_EVENT_RE.match(absu):
+            detail_links[absu] = None
 
     def _parse_detail(ev_url: str):
-        st, html, _ = req_with_cache(ev_url, headers={"User-Agent": user_agent}, throttle=(1, 3))
-        if st != 200 or not html:
-            return None
-        s = BeautifulSoup(html, "html.parser")
+        return _cached_detail("fxbg_detail", ev_url, {"User-Agent": user_agent}, _parse_detail_html)
+
+    def _parse_detail_html(html, ev_url):
+        s = BeautifulSoup(html, _HTML_PARSER)
 
         # JSON-LD first
-        for tag in s.select('script[type="application/ld+json"]'):
+        for payload in _event_jsonld_payloads(s):
             try:
-                data = json.loads(tag.string or "")
+                data = _json_loads(payload)
             except Exception:
                 continue
 
@@ -1248,7 +2220,7 @@ def fetch_fxbg_events(url: str, default_tz="America/New_York", user_agent="fxbg-
         for sel in ("time[datetime]", ".event-date", ".date", ".wp-block-post-date", ".tribe-events-schedule"):
             els = s.select(sel)
             if els and not date_text:
-                date_text = " ".join(e.get("datetime") or e.get_text(" ", strip=True) for e in els if (e.get("datetime") or e.get_text(strip=True)))
+                date_text = " ".join(t for t in (e.get("datetime") or e.get_text(" ", strip=True) for e in els) if t)
         sdt, edt = parse_when(_clean_text(date_text or ""), default_tz=default_tz)
 
         loc_guess = ""
@@ -1268,27 +2240,32 @@ def fetch_fxbg_events(url: str, default_tz="America/New_York", user_agent="fxbg-
             }
         return None
 
-    for ev_url in sorted(detail_links):
-        ev = _parse_detail(ev_url)
-        if ev:
-            out.append(ev)
+    # Detail GETs are independent and latency-bound; req_with_cache's per-host slots
+    # keep the site at FEEDS_HOST_CONCURRENCY in flight
+    with ThreadPoolExecutor(max_workers=max(1, int(os.getenv("FEEDS_WORKERS", "8")))) as ex:
+        out.extend(ev for ev in ex.map(_parse_detail, detail_links) if ev)
 
     if not out:
+        soup = doc if isinstance(doc, BeautifulSoup) else BeautifulSoup(body, _HTML_PARSER)
         cards = soup.select("article, .event, .events, .wp-block-post")
         for c in cards:
-            a = c.select_one("a[href]")
-            title = _clean_text(c.get_text(" ", strip=True))[:120]
-            href = urllib.parse.urljoin(url, a["href"]) if a and a.has_attr("href") else url
+            # Date first: cards without one are dropped before paying for the
+            # whole-card get_text() that the title needs
             date_text = ""
-            t = c.select_one("time[datetime]")
+            t = _SS_TIME.select_one(c)
             if t and t.get("datetime"):
                 date_text = t["datetime"]
             else:
-                dt_el = c.select_one(".date, .event-date, .wp-block-post-date")
+                dt_el = _SS_FXBG_CARD_DATE.select_one(c)
                 if dt_el:
                     date_text = dt_el.get_text(" ", strip=True)
             sdt, edt = parse_when(_clean_text(date_text), default_tz=default_tz)
-            if title and sdt:
+            if not sdt:
+                continue
+            title = _clean_text(c.get_text(" ", strip=True))[:120]
+            a = _SS_A_HREF.select_one(c)
+            href = urllib.parse.urljoin(url, a["href"]) if a and a.has_attr("href") else url
+            if title:
                 out.append({
                     "title": title,
                     "description": "",
@@ -1314,31 +2291,30 @@ def fetch_spotsy_townecentre(url: str, default_tz="America/New_York", user_agent
         return []
 
     status, body, _ = req_with_cache(url, headers={"User-Agent": user_agent}, throttle=(2, 5))
-    if status != 200 or not body:
+    if status not in (200, 304) or not body:
         return []
 
-    soup = BeautifulSoup(body, "html.parser")
+    # Link harvest on the cheap tree; bs4 is only needed if the card fallback runs
+    doc = _html_tree(body)
     out = []
 
-    detail_links = set()
-    for a in soup.select("a[href]"):
-        href = (a.get("href") or "").strip()
+    detail_links = {}  # insertion-ordered set: discovery order, no sort needed
+    for href in _page_hrefs(doc):
         if not href:
             continue
-        absu = urllib.parse.urljoin(url, href)
-        host = urllib.parse.urlsplit(absu).netloc
-        if "spotsylvaniatownecentre.com" in host and "/events/" in absu:
-            detail_links.add(absu)
+        absu = _urljoin(url, href)
+        if "/events/" in absu and _SPOTSY_HOST_RE.match(absu):
+            detail_links[absu] = None
 
     def _parse_detail(ev_url: str):
-        st, html, _ = req_with_cache(ev_url, headers={"User-Agent": user_agent}, throttle=(1, 3))
-        if st != 200 or not html:
-            return None
-        s = BeautifulSoup(html, "html.parser")
+        return _cached_detail("spotsy_detail", ev_url, {"User-Agent": user_agent}, _parse_detail_html)
+
+    def _parse_detail_html(html, ev_url):
+        s = BeautifulSoup(html, _HTML_PARSER)
 
-        for tag in s.select('script[type="application/ld+json"]'):
+        for payload in _event_jsonld_payloads(s):
             try:
-                data = json.loads(tag.string or "")
+                data = _json_loads(payload)
             except Exception:
                 continue
 
@@ -1408,24 +2384,28 @@ def fetch_spotsy_townecentre(url: str, default_tz="America/New_York", user_agent
             }
         return None
 
-    for ev_url in sorted(detail_links):
-        ev = _parse_detail(ev_url)
-        if ev:
-            out.append(ev)
+    # Detail GETs are independent and latency-bound; req_with_cache's per-host slots
+    # keep the site at FEEDS_HOST_CONCURRENCY in flight
+    with ThreadPoolExecutor(max_workers=max(1, int(os.getenv("FEEDS_WORKERS", "8")))) as ex:
+        out.extend(ev for ev in ex.map(_parse_detail, detail_links) if ev)
 
     if not out:
+        soup = doc if isinstance(doc, BeautifulSoup) else BeautifulSoup(body, _HTML_PARSER)
         cards = soup.select("article, .event, .events-list li, .event-card")
         for c in cards:
-            a = c.select_one("a[href]")
-            href = urllib.parse.urljoin(url, a["href"]) if a and a.has_attr("href") else url
-            title_el = c.select_one("h2, h3, .event-title, .card-title")
-            title = _clean_text(title_el.get_text(" ", strip=True)) if title_el else _clean_text(c.get_text(" ", strip=True))[:120]
-            dt_el = c.select_one("time[datetime], .date, .event-date, .when")
+            # Date first, as in fetch_fxbg_events: undated cards skip the title work
+            dt_el = _SS_SPOTSY_CARD_DATE.select_one(c)
             dt_text = ""
             if dt_el:
                 dt_text = dt_el.get("datetime") or dt_el.get_text(" ", strip=True)
             sdt, edt = parse_when(_clean_text(dt_text), default_tz=default_tz)
-            if title and sdt:
+            if not sdt:
+                continue
+            title_el = _SS_SPOTSY_CARD_TITLE.select_one(c)
+            title = _clean_text(title_el.get_text(" ", strip=True)) if title_el else _clean_text(c.get_text(" ", strip=True))[:120]
+            a = _SS_A_HREF.select_one(c)
+            href = urllib.parse.urljoin(url, a["href"]) if a and a.has_attr("href") else url
+            if title:
                 out.append({
                     "title": title,
                     "description": "",
@@ -1461,12 +2441,14 @@ def fetch_html(url, hints=None, user_agent="fxbg-event-bot/1.0", throttle=(2, 5)
         url, headers={"User-Agent": user_agent}, throttle=throttle
     )
     if status == 304:
-        return []
-    if status != 200 or not body:
+        cached = _cached_events("html", url, body)
+        if cached is not None:
+            return cached
+    if status not in (200, 304) or not body:
         return []
 
-    soup = BeautifulSoup(body, "html.parser")
-    out = []
+    soup = BeautifulSoup(body, _HTML_PARSER)
+    out = {}  # (title, start, link) -> event, first one wins
 
     css = hints
     items = soup.select(css.get("item")) if css.get("item") else []
@@ -1475,9 +2457,7 @@ def fetch_html(url, hints=None, user_agent="fxbg-event-bot/1.0", throttle=(2, 5)
             "time", attrs={"datetime": True}
         )
         maybe_text = (el.get_text(" ", strip=True) or "").lower()
-        looks_time = bool(
-            re.search(r"\b\d{1,2}(:\d{2})?\s*(a\.m\.|am|p\.m\.|pm)\b", maybe_text)
-        )
+        looks_time = bool(_LOOKS_TIME_RE.search(maybe_text))
         if (not time_node) and (not looks_time):
             continue
 
@@ -1492,7 +2472,8 @@ def fetch_html(url, hints=None, user_agent="fxbg-event-bot/1.0", throttle=(2, 5)
         loc = pick(css.get("location"))
         desc = pick(css.get("description"))
         s, e = parse_when(date_text)
-        out.append(
+        _add_event(
+            out,
             {
                 "title": title,
                 "description": desc,
@@ -1509,14 +2490,12 @@ def fetch_html(url, hints=None, user_agent="fxbg-event-bot/1.0", throttle=(2, 5)
         d = soup.select_one("time, .date, p")
         if t:
             s, e = parse_when(d.get_text(" ", strip=True) if d else None)
-            out.append(
+            body_el = soup.body
+            _add_event(
+                out,
                 {
                     "title": t.get_text(" ", strip=True),
-                    "description": (
-                        soup.select_one("body").get_text(" ", strip=True)[:500]
-                        if soup.select_one("body")
-                        else ""
-                    ),
+                    "description": body_el.get_text(" ", strip=True)[:500] if body_el else "",
                     "link": url,
                     "start": s.isoformat() if s else None,
                     "end": e.isoformat() if e else None,
@@ -1525,7 +2504,7 @@ def fetch_html(url, hints=None, user_agent="fxbg-event-bot/1.0", throttle=(2, 5)
                 }
             )
 
-    return [e for e in out if e.get("title")]
+    return _remember_events("html", url, body, [e for e in out.values() if e.get("title")])
 
 
 def fetch_eventbrite(api_url, token_env=None):
@@ -1534,32 +2513,36 @@ def fetch_eventbrite(api_url, token_env=None):
       - If `api_url` looks like an Eventbrite discovery or event HTML URL, use the HTML crawler.
       - Otherwise, use API path only if a token is provided.
     """
-    if re.search(r"//[^/]*eventbrite\.com/(d/|e/)", api_url):
-        if os.getenv("FEEDS_DEBUG"):
+    debug = bool(os.getenv("FEEDS_DEBUG"))
+    if _EB_HTML_URL_RE.search(api_url):
+        if debug:
             LOG.debug("→ Eventbrite discovery crawl: %s", api_url)
         return fetch_eventbrite_discovery(api_url, pages=3)
 
     token = token_env or os.getenv("EVENTBRITE_TOKEN") or ""
     if not token:
-        if os.getenv("FEEDS_DEBUG"):
+        if debug:
             LOG.debug("   Eventbrite API: missing token (and URL is not discovery/detail); returning []")
         return []
     headers = {"Authorization": f"Bearer {token}"}
-    status, body, _ = req_with_cache(api_url, headers=headers, throttle=(2, 5))
+    # JSON goes straight from bytes to objects (orjson); skip requests' text decoding
+    status, body, _ = req_with_cache(api_url, headers=headers, throttle=(2, 5), want="bytes")
     if status == 304:
-        return []
-    if status != 200:
-        if os.getenv("FEEDS_DEBUG"):
+        cached = _cached_events("eventbrite", api_url, body)
+        if cached is not None:
+            return cached
+    if status not in (200, 304):
+        if debug:
             LOG.debug("   Eventbrite HTTP %s", status)
-            LOG.debug("%s", (body or "")[:200])
+            LOG.debug("%s", (body or b"")[:200].decode("utf-8", "replace"))
         return []
     try:
-        data = json.loads(body)
-        if os.getenv("FEEDS_DEBUG"):
+        data = _json_loads(body)
+        if debug and LOG.isEnabledFor(logging.DEBUG):
             LOG.debug("   Eventbrite ok: top-level keys=%s", list(data.keys()))
     except Exception:
         return []
-    out = []
+    out = {}  # (title, start, link) -> event, first one wins
     events = data.get("events") or data.get("data") or []
     for ev in events:
         title = (ev.get("name", {}) or {}).get("text") or ev.get("name")
@@ -1571,7 +2554,8 @@ def fetch_eventbrite(api_url, token_env=None):
             venue_name = ev["venue"].get("name")
         elif ev.get("venue_id"):
             venue_name = f"Venue ID {ev['venue_id']}"
-        out.append(
+        _add_event(
+            out,
             {
                 "title": title,
                 "description": desc,
@@ -1582,11 +2566,12 @@ def fetch_eventbrite(api_url, token_env=None):
                 "source": "eventbrite",
             }
         )
-    return out
+    return _remember_events("eventbrite", api_url, body, list(out.values()))
 
 
 def fetch_bandsintown(url, app_id_env=None):
-    if os.getenv("FEEDS_DEBUG"):
+    debug = bool(os.getenv("FEEDS_DEBUG"))
+    if debug:
         LOG.debug(
             "   Bandsintown app_id present? %s",
             "YES" if (app_id_env or os.getenv("BANDSINTOWN_APP_ID")) else "NO",
@@ -1594,20 +2579,22 @@ def fetch_bandsintown(url, app_id_env=None):
     app_id = app_id_env or os.getenv("BANDSINTOWN_APP_ID") or ""
     u = url.replace("${BANDSINTOWN_APP_ID}", app_id)
     if not app_id:
-        if os.getenv("FEEDS_DEBUG"):
+        if debug:
             LOG.debug("   Bandsintown missing app_id (empty)")
         return []
-    status, body, _ = req_with_cache(u, headers={"User-Agent": "fxbg-event-bot/1.0"})
+    status, body, _ = req_with_cache(u, headers={"User-Agent": "fxbg-event-bot/1.0"}, want="bytes")
     if status == 304:
-        return []
-    if status != 200:
-        if os.getenv("FEEDS_DEBUG"):
+        cached = _cached_events("bandsintown", u, body)
+        if cached is not None:
+            return cached
+    if status not in (200, 304):
+        if debug:
             LOG.debug("   Bandsintown HTTP %s", status)
-            LOG.debug("%s", (body or "")[:200])
+            LOG.debug("%s", (body or b"")[:200].decode("utf-8", "replace"))
         return []
     try:
-        data = json.loads(body)
-        if os.getenv("FEEDS_DEBUG"):
+        data = _json_loads(body)
+        if debug and LOG.isEnabledFor(logging.DEBUG):
             LOG.debug(
                 "   Bandsintown ok: type=%s, count=%s",
                 "list" if isinstance(data, list) else type(data).__name__,
@@ -1615,7 +2602,7 @@ def fetch_bandsintown(url, app_id_env=None):
             )
     except Exception:
         return []
-    out = []
+    out = {}  # (title, start, link) -> event, first one wins
     seq = data if isinstance(data, list) else data.get("events", [])
     for ev in seq:
         lineup = ev.get("lineup") or []
@@ -1628,7 +2615,8 @@ def fetch_bandsintown(url, app_id_env=None):
         venue = ev.get("venue", {})
         location = venue.get("name")
         link = ev.get("url") or ev.get("offer_url")
-        out.append(
+        _add_event(
+            out,
             {
                 "title": title,
                 "description": desc,
@@ -1639,7 +2627,7 @@ def fetch_bandsintown(url, app_id_env=None):
                 "source": "bandsintown",
             }
         )
-    return out
+    return _remember_events("bandsintown", u, body, list(out.values()))
 
 
 # ---- Public helper to resolve clean Eventbrite location from a detail URL ----
@@ -1654,19 +2642,74 @@ def resolve_eventbrite_location(detail_url: str) -> str:
     return (loc or "").strip()
 
 
-def _extract_dates_from_html(soup, default_tz="America/New_York"):
+def _scan_mackid_detail(soup, want_ics=True):
     """
-    Return (iso_start, iso_end, date_text_fallback) where iso_* are ISO strings
-    if available, else None. date_text_fallback is a human text block if found.
+    One document-order walk over a MacKID detail soup, collecting everything the
+    requests-path parser used to find with separate select()/find_all() passes.
+    First match wins for the single-valued slots, as select_one() did.
+    want_ics=False skips the per-anchor ICS tests (the caller ruled them out).
+    """
+    found = {
+        "ics": None, "h1": None, "title": None, "desc": None, "loc": None, "meta_start": None,
+        "meta_end": None, "dates": [], "times": [], "jsonld": [],
+    }
+    for tag in soup.find_all(True):
+        name = tag.name
+        attrs = tag.attrs
+        if name == "a":
+            href = (attrs.get("href") or "").strip() if "href" in attrs else None
+            if href is not None and want_ics and found["ics"] is None and (
+                _ICS_RX.search(href) or _ICS_RX.search(tag.get_text(" ", strip=True) or "")
+            ):
+                found["ics"] = href
+        elif name == "h1":
+            found["h1"] = found["h1"] or tag
+        elif name == "time":
+            if "datetime" in attrs:
+                found["times"].append(attrs.get("datetime") or "")
+        elif name == "meta":
+            prop = attrs.get("itemprop")
+            if prop in ("startDate", "startdate") and found["meta_start"] is None:
+                found["meta_start"] = tag
+            elif prop in ("endDate", "enddate") and found["meta_end"] is None:
+                found["meta_end"] = tag
+        elif name == "script":
+            if attrs.get("type") == "application/ld+json":
+                found["jsonld"].append(str(tag.string or ""))
+            continue
+
+        el = attrs.get("data-element")
+        cls = attrs.get("class") or ()
+        if el == "event-title":
+            found["title"] = found["title"] or tag
+        if found["desc"] is None and (
+            el == "event-description" or "article-content" in cls or "event-description" in cls
+        ):
+            found["desc"] = tag
+        if found["loc"] is None and (
+            el == "event-location" or "event-location" in cls or "location" in cls
+            or attrs.get("itemprop") == "location"
+        ):
+            found["loc"] = tag
+        if el == "event-date" or "event-date" in cls or "event-time" in cls:
+            found["dates"].append(tag)
+    return found
+
+
+def _pick_event_dates(jsonld_texts, times, meta_start, meta_end, when_text):
+    """
+    Shared date picking for MacKID detail pages, whether the pieces came from bs4 or
+    from the in-browser extractor. `when_text` is a zero-arg callable so the costly
+    visible-block scan only runs when nothing structured was found.
+    Returns (iso_start, iso_end, date_text_fallback).
     """
-    import json as _json
     iso_start = iso_end = None
     date_text = None
 
     # 1) JSON-LD @type=Event (also scans @graph)
-    for tag in soup.select('script[type="application/ld+json"]'):
+    for raw in jsonld_texts:
         try:
-            data = _json.loads(tag.string or "")
+            data = _json_loads(raw or "")
         except Exception:
             continue
 
@@ -1696,50 +2739,113 @@ def _extract_dates_from_html(soup, default_tz="America/New_York"):
 
     # 2) <time datetime="...">
     if not (iso_start or iso_end):
-        ts = [t.get("datetime") for t in soup.select("time[datetime]") if t.get("datetime")]
-        if ts:
-            iso_start = ts[0]
-            if len(ts) > 1:
-                iso_end = ts[1]
+        if times:
+            iso_start = times[0]
+            if len(times) > 1:
+                iso_end = times[1]
 
     # 3) meta itemprop
     if not (iso_start or iso_end):
-        m_start = soup.select_one("meta[itemprop='startDate'], meta[itemprop='startdate']")
-        m_end   = soup.select_one("meta[itemprop='endDate'], meta[itemprop='enddate']")
-        if m_start and m_start.get("content"):
-            iso_start = (m_start["content"] or "").strip() or iso_start
-        if m_end and m_end.get("content"):
-            iso_end = (m_end["content"] or "").strip() or iso_end
+        iso_start = (meta_start or "").strip() or iso_start
+        iso_end = (meta_end or "").strip() or iso_end
 
     # 4) Visible block with date/time words
     if not (iso_start or iso_end):
-        dt_blk = soup.find(
-            lambda t: t and t.name in ("section", "div")
-            and any(k in t.get_text(" ", strip=True) for k in ("Date", "Time", "When"))
-        )
-        if dt_blk:
-            date_text = dt_blk.get_text(" ", strip=True)
+        date_text = when_text() or None
 
     return iso_start, iso_end, date_text
 
 
+def _extract_dates_from_html(soup, default_tz="America/New_York", html=None):
+    """
+    Return (iso_start, iso_end, date_text_fallback) where iso_* are ISO strings
+    if available, else None. date_text_fallback is a human text block if found.
+    Pass the raw `html` too and JSON-LD is read by regex instead of walking the soup.
+    """
+    def _when_text():
+        # Targeted markup first (one soupsieve walk), then a bounded generic scan
+        dt_blk = _SS_WHEN_BLOCK.select_one(soup)
+        if dt_blk is None:
+            for node in soup.find_all(["section", "div"], limit=200):
+                txt = node.get_text(" ", strip=True)
+                if any(k in txt for k in ("Date", "Time", "When")):
+                    return txt
+            return None
+        return dt_blk.get_text(" ", strip=True)
+
+    m_start = _SS_META_START.select_one(soup)
+    m_end = _SS_META_END.select_one(soup)
+    jsonld = _jsonld_payloads(html) if html else []
+    return _pick_event_dates(
+        jsonld or [tag.string for tag in _SS_JSONLD.select(soup)],
+        [t.get("datetime") for t in _SS_TIME.select(soup) if t.get("datetime")],
+        m_start.get("content") if m_start else None,
+        m_end.get("content") if m_end else None,
+        _when_text,
+    )
+
+
+# In-browser extraction for MacKID detail pages: one evaluate() round-trip returns the
+# fields the bs4 fallback would read, instead of shipping the whole DOM to Python.
+_MACKID_DETAIL_JS = """
+() => {
+  const txt = el => el ? (el.textContent || "").replace(/\\s+/g, " ").trim() : "";
+  const q = s => document.querySelector(s);
+  const attr = (s, a) => { const el = q(s); return el ? (el.getAttribute(a) || "") : ""; };
+  const anchors = [...document.querySelectorAll("a[href]")].map(a => ({
+    href: (a.getAttribute("href") || "").trim(),
+    text: (a.textContent || "").toLowerCase(),
+  }));
+  const ics = anchors.find(a => a.href.toLowerCase().endsWith(".ics"))
+    || anchors.find(a => a.text.includes("apple calendar"))
+    || anchors.find(a => a.href.toLowerCase().startsWith("data:text/calendar"));
+  const when = document.querySelector("div[class*=date i], div[class*=when i]")
+    || [...document.querySelectorAll("section, div")].slice(0, 200)
+      .find(el => /Date|Time|When/.test(el.textContent || ""));
+  return {
+    title: txt(q("h1") || q("[data-element='event-title']")),
+    description: txt(q("[data-element='event-description'], .article-content, .event-description")),
+    location: txt(q("[data-element='event-location'], .event-location, .location, [itemprop='location']")),
+    jsonld: [...document.querySelectorAll("script[type='application/ld+json']")].map(s => s.textContent || ""),
+    times: [...document.querySelectorAll("time[datetime]")].map(t => t.getAttribute("datetime")).filter(Boolean),
+    meta_start: attr("meta[itemprop='startDate'], meta[itemprop='startdate']", "content"),
+    meta_end: attr("meta[itemprop='endDate'], meta[itemprop='enddate']", "content"),
+    when: when ? txt(when) : "",
+    ics: ics ? ics.href : null,
+  };
+}
+"""
+
+
 # ---------- Macaroni KID Fredericksburg (Playwright) ----------
 def fetch_macaronikid_fxbg_playwright(days=60, user_agent=None, headless=True, save_artifacts=True):
     """
     Playwright crawler for Macaroni KID Fredericksburg.
     - Visits list pages (/events, /events/calendar, /events?page=1..8)
     - Collects detail links that look like real events
+    - Visits detail pages through a small page pool (MAC_KID_PW_PAGES, default 4)
     - Prefers per-event .ics (including data: URIs) via fetch_ics()
     - Falls back to parsing HTML blocks (same logic as requests fallback)
     Returns raw event dicts to be normalized by normalize_event().
     """
-    from playwright.sync_api import sync_playwright
-    from urllib.parse import urlsplit, urlunsplit, urljoin
+    import asyncio
+    return asyncio.run(
+        _macaronikid_fxbg_playwright(
+            days=days, user_agent=user_agent, headless=headless, save_artifacts=save_artifacts
+        )
+    )
+
+
+async def _macaronikid_fxbg_playwright(days=60, user_agent=None, headless=True, save_artifacts=True):
+    from playwright.async_api import async_playwright
+    from urllib.parse import urlsplit, urljoin
     from datetime import datetime
+    import asyncio
     import pathlib
-    import re as _re
-
+    import queue
     log = logging.getLogger("sources")
+    debug = bool(os.getenv("FEEDS_DEBUG"))
+    page_cap = int(os.getenv("MAC_KID_PAGE_CAP", "500"))  # links mined per list page
 
     base = "https://fredericksburg.macaronikid.com"
     start_urls = [
@@ -1753,184 +2859,244 @@ def fetch_macaronikid_fxbg_playwright(days=60, user_agent=None, headless=True, s
         "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36"
     )
 
-    def _detail_links(html, page_url):
-        soup = BeautifulSoup(html, "html.parser")
-        links = set()
-        pat = _re.compile(r"^/events/[0-9a-f]{8,}(?:/[\w\-]*)?$", _re.I)
-        for a in soup.select("a[href*='/events/']"):
-            href = (a.get("href") or "").split("?", 1)[0].strip()
-            if not href:
-                continue
-            absu = urljoin(page_url, href)
-            try:
-                p = urlsplit(absu).path
-            except Exception:
-                p = href
-            if pat.match(p) and not p.rstrip("/").endswith("/events") and not p.rstrip("/").endswith("/events/calendar"):
-                links.add(absu)
-        return links
-
     def _slug(s):
         s = (s or "").lower()
-        s = _re.sub(r"[^a-z0-9]+", "-", s).strip("-")
+        s = _SLUG_RE.sub("-", s).strip("-")
         return s[:80] or "event"
 
+    def _parse_detail_html(html, ev_url):
+        """HTML fallback (robust date extraction). CPU-bound, so it runs off the event loop."""
+        soup = BeautifulSoup(html, _HTML_PARSER, parse_only=_DETAIL_STRAIN)
+
+        h = _SS_H1.select_one(soup) or _SS_EVENT_TITLE.select_one(soup)
+        title_txt = h.get_text(" ", strip=True) if h else None
+
+        d = _SS_EVENT_DESC.select_one(soup)
+        desc = d.get_text(" ", strip=True) if d else ""
+
+        l = _SS_EVENT_LOC.select_one(soup)
+        loc = l.get_text(" ", strip=True) if l else None
+
+        return _detail_event(ev_url, title_txt, desc, loc, *_extract_dates_from_html(soup, html=html))
+
+    def _detail_event(ev_url, title_txt, desc, loc, iso_start, iso_end, date_text):
+        combined_dt = None
+        if iso_start or iso_end:
+            combined_dt = f"{iso_start or ''} {iso_end or ''}".strip()
+        elif date_text:
+            combined_dt = date_text
+
+        if debug:
+            log.debug(
+                "MacKID parsed: %s | date_text: %s",
+                (title_txt or "")[:80],
+                (combined_dt or "")[:120],
+            )
+
+        sdt = edt = None
+        if iso_start or iso_end:
+            # JSON-LD / <time datetime> values are ISO-8601 already: skip parse_when
+            sdt = _parse_dt(iso_start)
+            edt = _parse_dt(iso_end)
+        if not sdt and combined_dt:
+            sdt, edt = parse_when(combined_dt, default_tz="America/New_York")
+
+        if not sdt:
+            if debug:
+                log.debug("MacKID skip (no date): %s", ev_url)
+            return []
+
+        return [{
+            "title": title_txt or "(untitled)",
+            "description": desc or "",
+            "link": ev_url,
+            "start": sdt.isoformat(),
+            "end": (edt.isoformat() if edt else None),
+            "location": loc,
+            "source": "macaronikid",
+        }]
+
     out = []
-    with sync_playwright() as pw:
-        browser = pw.chromium.launch(headless=headless)
-        ctx = browser.new_context(
+    async with async_playwright() as pw:
+        browser = await pw.chromium.launch(headless=headless)
+        ctx = await browser.new_context(
             user_agent=ua,
             locale="en-US",
             timezone_id="America/New_York",
             viewport={"width": 1366, "height": 900},
             extra_http_headers={"Accept-Language": "en-US,en;q=0.9"},
         )
-        page = ctx.new_page()
+        page = await ctx.new_page()
 
         detail_urls = set()
         for u in start_urls:
             try:
-                page.goto(u, wait_until="networkidle", timeout=45000)
-                html = page.content()
-                new_links = _detail_links(html, u)
-                detail_urls |= new_links
-                logging.getLogger("sources").debug("MacKID(PW) %s -> added %d (cum=%d)", u, len(new_links), len(detail_urls))
+                await page.goto(u, wait_until="domcontentloaded", timeout=45000)
+                try:
+                    # cards render client-side; wait for the first event link, not network silence
+                    await page.wait_for_selector("a[href*='/events/']", state="attached", timeout=15000)
+                except Exception:
+                    pass
+                html = await page.content()
+                new_links = _mackid_event_links(html, u, cap=page_cap)
+                detail_urls.update(new_links)
+                log.debug("MacKID(PW) %s -> added %d (cum=%d)", u, len(new_links), len(detail_urls))
             except Exception as ex:
-                logging.getLogger("sources").warning("MacKID(PW) listing error on %s: %s", u, str(ex)[:160])
+                log.warning("MacKID(PW) listing error on %s: %s", u, str(ex)[:160])
 
         if not detail_urls:
-            logging.getLogger("sources").info("MacKID(PW) collected events: 0")
-            ctx.close(); browser.close()
+            log.info("MacKID(PW) collected events: 0")
+            await ctx.close(); await browser.close()
             return out
 
         debug_dir = pathlib.Path("data/debug")
         if save_artifacts:
             debug_dir.mkdir(parents=True, exist_ok=True)
 
-        for ev_url in sorted(detail_urls):
-            try:
-                page.goto(ev_url, wait_until="domcontentloaded", timeout=45000)
-                title = (page.title() or "").strip()
-                if any(k in title for k in ("Just a moment", "Attention Required", "Please Wait")):
-                    logging.getLogger("sources").warning("MacKID(PW): challenge on detail, waiting… %s", ev_url)
-                    page.wait_for_timeout(5000)
-                    page.wait_for_load_state("networkidle", timeout=20000)
-
-                page.wait_for_load_state("networkidle", timeout=30000)
-                html = page.content()
-                title = page.title() or ""
-
-                if save_artifacts and os.getenv("FEEDS_DEBUG"):
-                    ts = datetime.now().strftime("%Y%m%d-%H%M%S")
-                    path_part = urlsplit(ev_url).path.strip("/").replace("/", "_")
-                    stem = f"mackid_detail_{ts}__{path_part}_{_slug(title)}"
-                    png = debug_dir / (stem + ".png")
-                    htm = debug_dir / (stem + ".html")
-                    try:
-                        page.screenshot(path=str(png), full_page=True)
-                    except Exception:
-                        pass
-                    try:
-                        htm.write_text(html, encoding="utf-8")
-                    except Exception:
-                        pass
-                    logging.getLogger("sources").debug("MacKID(PW) saved artifacts: %s , %s", png, htm)
-
-                logging.getLogger("sources").debug("MacKID(PW) detail %s -> status=200 title=%r", ev_url, title)
-
-                # Prefer per-event ICS link (can be HTTPS OR data:text/calendar)
-                ics_href = None
-                try:
-                    anchors = page.eval_on_selector_all(
-                        "a[href]",
-                        "els => els.map(e => ({ href: e.getAttribute('href') || '', text: (e.textContent || '').toLowerCase().trim() }))"
-                    ) or []
-
-                    for a in anchors:
-                        h = (a['href'] or '').strip()
-                        if h.lower().endswith('.ics'):
-                            ics_href = h
-                            break
-
-                    if not ics_href:
-                        for a in anchors:
-                            if 'apple calendar' in a['text']:
-                                ics_href = (a['href'] or '').strip()
-                                break
+        loop = asyncio.get_running_loop()
 
-                    if not ics_href:
-                        for a in anchors:
-                            h = (a['href'] or '').strip()
-                            if h.lower().startswith('data:text/calendar'):
-                                ics_href = h
-                                break
-                except Exception:
-                    ics_href = None
+        # Debug artifacts go to disk on a background thread so the detail pool never
+        # waits on file I/O; drained before the browser closes.
+        artifacts = None
+        if save_artifacts and debug:
+            artifacts = queue.Queue()
 
-                if ics_href:
-                    ics_abs = urljoin(ev_url, ics_href)
+            def _artifact_writer():
+                while True:
+                    path, data = artifacts.get()
                     try:
-                        evs = fetch_ics(ics_abs, user_agent="fxbg-event-bot/1.0") or []
-                        for e in evs:
-                            e["source"] = "macaronikid"
-                            e.setdefault("link", ev_url)
-                        out.extend(evs)
-                        logging.getLogger("sources").debug("MacKID(PW): ICS ok %s -> +%d", ics_abs, len(evs))
-                        continue
+                        path.write_bytes(data)
                     except Exception as ex:
-                        logging.getLogger("sources").warning("MacKID(PW) ICS parse failed %s: %s", ics_abs, str(ex)[:160])
+                        log.debug("MacKID(PW) artifact write failed %s: %s", path, str(ex)[:160])
+                    finally:
+                        artifacts.task_done()
 
-                # ---- HTML fallback (robust date extraction)
-                soup = BeautifulSoup(html, "html.parser")
+            threading.Thread(target=_artifact_writer, name="mackid-artifacts", daemon=True).start()
 
-                h = soup.select_one("h1") or soup.select_one("[data-element='event-title']")
-                title_txt = h.get_text(" ", strip=True) if h else None
+        async def visit(wpage, ev_url):
+            await wpage.goto(ev_url, wait_until="domcontentloaded", timeout=45000)
+            title = (await wpage.title() or "").strip()
+            if _CHALLENGE_RE.search(title):
+                log.warning("MacKID(PW): challenge on detail, waiting… %s", ev_url)
+                await wpage.wait_for_function(_PW_CHALLENGE_CLEARED_JS, timeout=20000)
 
-                d = soup.select_one("[data-element='event-description'], .article-content, .event-description")
-                desc = d.get_text(" ", strip=True) if d else ""
+            # Wait for the event markup itself rather than 500ms of network silence
+            try:
+                await wpage.wait_for_selector(
+                    "h1, script[type='application/ld+json'], time[datetime]", state="attached", timeout=15000
+                )
+            except Exception:
+                pass
+            title = await wpage.title() or ""
 
-                l = soup.select_one("[data-element='event-location'], .event-location, .location, [itemprop='location']")
-                loc = l.get_text(" ", strip=True) if l else None
+            # Pull just the fields we need out of the live DOM (no page.content() + bs4)
+            try:
+                res = await wpage.evaluate(_MACKID_DETAIL_JS) or {}
+            except Exception as ex:
+                log.debug("MacKID(PW) in-page extract failed %s: %s", ev_url, str(ex)[:160])
+                res = {}
+
+            if artifacts is not None:
+                ts = datetime.now().strftime("%Y%m%d-%H%M%S")
+                path_part = urlsplit(ev_url).path.strip("/").replace("/", "_")
+                stem = f"mackid_detail_{ts}__{path_part}_{_slug(title)}"
+                png = debug_dir / (stem + ".png")
+                htm = debug_dir / (stem + ".html")
+                try:
+                    artifacts.put((png, await wpage.screenshot(full_page=True)))
+                except Exception:
+                    pass
+                try:
+                    artifacts.put((htm, (await wpage.content()).encode("utf-8")))
+                except Exception:
+                    pass
+                log.debug("MacKID(PW) queued artifacts: %s , %s", png, htm)
 
-                iso_start, iso_end, date_text = _extract_dates_from_html(soup)
-                combined_dt = None
-                if iso_start or iso_end:
-                    combined_dt = f"{iso_start or ''} {iso_end or ''}".strip()
-                elif date_text:
-                    combined_dt = date_text
+            log.debug("MacKID(PW) detail %s -> status=200 title=%r", ev_url, title)
 
-                if os.getenv("FEEDS_DEBUG"):
-                    logging.getLogger("sources").debug(
-                        "MacKID parsed: %s | date_text: %s",
-                        (title_txt or "")[:80],
-                        (combined_dt or "")[:120],
-                    )
+            # Prefer per-event ICS link (can be HTTPS OR data:text/calendar)
+            ics_href = (res.get("ics") or "").strip() or None
 
-                sdt = edt = None
-                if combined_dt:
-                    sdt, edt = parse_when(combined_dt, default_tz="America/New_York")
+            if ics_href:
+                ics_abs = urljoin(ev_url, ics_href)
+                try:
+                    # blocking requests call: keep it off the event loop
+                    evs = await loop.run_in_executor(None, fetch_ics, ics_abs, "fxbg-event-bot/1.0") or []
+                    for e in evs:
+                        e["source"] = "macaronikid"
+                        e.setdefault("link", ev_url)
+                    log.debug("MacKID(PW): ICS ok %s -> +%d", ics_abs, len(evs))
+                    return evs
+                except Exception as ex:
+                    log.warning("MacKID(PW) ICS parse failed %s: %s", ics_abs, str(ex)[:160])
+
+            if res.get("title") or res.get("jsonld") or res.get("times") or res.get("meta_start"):
+                when = res.get("when") or ""
+                dates = _pick_event_dates(
+                    res.get("jsonld") or [],
+                    res.get("times") or [],
+                    res.get("meta_start"),
+                    res.get("meta_end"),
+                    lambda: when,
+                )
+                return _detail_event(
+                    ev_url, res.get("title") or None, res.get("description") or "",
+                    res.get("location") or None, *dates,
+                )
 
-                if not sdt:
-                    if os.getenv("FEEDS_DEBUG"):
-                        logging.getLogger("sources").debug("MacKID skip (no date): %s", ev_url)
-                    continue
+            # In-page extraction came back empty: parse the full DOM with bs4 instead.
+            # Hand back the pending future so this page can navigate on while it parses.
+            html = await wpage.content()
+            return loop.run_in_executor(parse_pool, _parse_detail_html, html, ev_url)
 
-                out.append({
-                    "title": title_txt or "(untitled)",
-                    "description": desc or "",
-                    "link": ev_url,
-                    "start": sdt.isoformat(),
-                    "end": (edt.isoformat() if edt else None),
-                    "location": loc,
-                    "source": "macaronikid",
-                })
+        queue = asyncio.Queue()
+        for ev_url in detail_urls:  # output is put in URL order below; no need to sort the feed
+            queue.put_nowait(ev_url)
+        parsed = {}
+        pending = []  # (ev_url, future) for bs4 parses still running on parse_pool
+        parse_pool = ThreadPoolExecutor(max_workers=max(1, int(os.getenv("MAC_KID_PARSE_WORKERS", "4"))))
 
-            except Exception as ex:
-                logging.getLogger("sources").warning("MacKID(PW) detail error %s: %s", ev_url, str(ex)[:160])
+        async def detail_worker():
+            wpage = await ctx.new_page()
+            try:
+                while True:
+                    try:
+                        ev_url = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+                    try:
+                        res = await visit(wpage, ev_url)
+                        if isinstance(res, asyncio.Future):
+                            pending.append((ev_url, res))
+                        else:
+                            parsed[ev_url] = res
+                    except Exception as ex:
+                        log.warning("MacKID(PW) detail error %s: %s", ev_url, str(ex)[:160])
+            finally:
+                await wpage.close()
+
+        n_workers = min(max(1, int(os.getenv("MAC_KID_PW_PAGES", "4"))), len(detail_urls))
+        try:
+            await asyncio.gather(*(detail_worker() for _ in range(n_workers)))
+            for ev_url, fut in pending:
+                try:
+                    parsed[ev_url] = await fut
+                except Exception as ex:
+                    log.warning("MacKID(PW) detail parse error %s: %s", ev_url, str(ex)[:160])
+        finally:
+            parse_pool.shutdown(wait=False)
+
+        seen = {}  # ICS feeds often repeat an event across detail pages
+        for ev_url in sorted(detail_urls):
+            for ev in parsed.get(ev_url) or []:
+                _add_event(seen, ev)
+        out = list(seen.values())
 
-        ctx.close(); browser.close()
+        if artifacts is not None:
+            await loop.run_in_executor(None, artifacts.join)
+        await ctx.close(); await browser.close()
 
-    logging.getLogger("sources").info("MacKID(PW) collected events: %d", len(out))
+    log.info("MacKID(PW) collected events: %d", len(out))
     return out
 
 
@@ -1945,7 +3111,8 @@ def fetch_macaronikid_fxbg(days=60, user_agent=None):
       - per-event: prefer .ics link (handles http(s) and data:), fallback to HTML dates
     Returns raw events to be normalized by normalize_event().
     """
-    import json as _json
+    debug = bool(os.getenv("FEEDS_DEBUG"))
+    page_cap = int(os.getenv("MAC_KID_PAGE_CAP", "500"))  # links mined per list page
 
     user_agent = user_agent or os.getenv("MAC_KID_UA") or (
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -1963,9 +3130,11 @@ def fetch_macaronikid_fxbg(days=60, user_agent=None):
 
     def _extract_links_from_jsonld(html, page_url):
         links = set()
-        for tag in BeautifulSoup(html, "html.parser").select('script[type="application/ld+json"]'):
+        for raw in _jsonld_payloads(html) or _iter_jsonld_texts(html):
+            if len(links) >= page_cap:
+                break  # enough; skip parsing the rest of the page
             try:
-                data = _json.loads(tag.string or "")
+                data = _json_loads(raw)
             except Exception:
                 continue
             seq = []
@@ -1980,62 +3149,63 @@ def fetch_macaronikid_fxbg(days=60, user_agent=None):
                 if node.get("@type") in ("Event", "Festival"):
                     u = (node.get("url") or "").strip()
                     if u:
-                        links.add(urllib.parse.urljoin(page_url, u))
-        return links
-
-    def _extract_links_by_regex(html, page_url):
-        """
-        Scan entire HTML (including scripts) for event URLs like:
-          /events/<hex>[/slug]
-        Accept both absolute and relative.
-        """
-        links = set()
-        pat = re.compile(
-            r"https?://[^\"'\s]*?/events/[0-9a-f]{8,}(?:/[A-Za-z0-9\-_%]+)?|/events/[0-9a-f]{8,}(?:/[A-Za-z0-9\-_%]+)?",
-            re.I,
-        )
-        for m in pat.finditer(html):
-            href = m.group(0)
-            links.add(urllib.parse.urljoin(page_url, href))
+                        links.add(_urljoin(page_url, u))
         return links
 
-    def _crawl_sitemap(sitemap_url, acc, site_base, depth=0, max_depth=2):
-        if depth > max_depth:
+    def _crawl_sitemap(sitemap_url, acc, site_base, visited, depth=0, max_depth=2):
+        if depth > max_depth or sitemap_url in visited or sitemap_stop.is_set():
             return
-        st, body, _ = req_with_cache(sitemap_url, headers={"User-Agent": "fxbg-event-bot/1.0"}, throttle=(1, 2))
+        visited.add(sitemap_url)
+        st, body, _ = req_with_cache(
+            sitemap_url, headers={"User-Agent": "fxbg-event-bot/1.0"}, throttle=(1, 2), want="bytes"
+        )
         HTTP_LOG.debug("HTTP GET %s -> %s", sitemap_url, st)
-        if st != 200 or not body:
+        if st not in (200, 304) or not body:
             return
-        soup = BeautifulSoup(body, "xml")
+        try:
+            root = _etree.fromstring(body)
+            index_locs = [(el.text or "") for el in root.iterfind(".//{*}sitemap/{*}loc")]
+            url_locs = [(el.text or "") for el in root.iterfind(".//{*}url/{*}loc")]
+        except Exception:
+            # no lxml or not well-formed XML: let bs4 be lenient about it
+            soup = BeautifulSoup(body, "xml")
+            index_locs = [loc.get_text() or "" for loc in soup.select("sitemap > loc")]
+            url_locs = [loc.get_text() or "" for loc in soup.select("url > loc")]
         # sitemap index?
-        for loc in soup.select("sitemap > loc"):
-            u = (loc.get_text() or "").strip()
+        for u in index_locs:
+            u = u.strip()
             if u:
-                _crawl_sitemap(u, acc, site_base, depth=depth + 1, max_depth=max_depth)
-        # urlset
-        for loc in soup.select("url > loc"):
-            u = (loc.get_text() or "").strip()
-            if u and urllib.parse.urlsplit(u).netloc.endswith(urllib.parse.urlsplit(site_base).netloc):
+                _crawl_sitemap(u, acc, site_base, visited, depth=depth + 1, max_depth=max_depth)
+        # urlset (site_base is the same for every <loc>; split it once)
+        site_host = urllib.parse.urlsplit(site_base).netloc
+        for u in url_locs:
+            u = u.strip()
+            if u and urllib.parse.urlsplit(u).netloc.endswith(site_host):
                 acc.add(u)
 
     def _sitemap_event_links(site_base):
         found = set()
+        visited = set()  # robots.txt usually points at /sitemap.xml too
+        if sitemap_stop.is_set():
+            return found  # the list pages were enough before this worker even started
         try:
             parts = urllib.parse.urlsplit(site_base)
             robots_url = f"{parts.scheme}://{parts.netloc}/robots.txt"
             st, body, _ = req_with_cache(robots_url, headers={"User-Agent": "fxbg-event-bot/1.0"}, throttle=(1, 2))
-            if st == 200 and body:
+            if st in (200, 304) and body:
                 for ln in body.splitlines():
+                    if sitemap_stop.is_set():
+                        break
                     if ln.lower().startswith("sitemap:"):
                         sm = ln.split(":", 1)[1].strip()
-                        _crawl_sitemap(sm, found, site_base)
+                        _crawl_sitemap(sm, found, site_base, visited)
         except Exception as ex:
             LOG.debug("MacKID sitemap robots error: %s", str(ex)[:140])
-        if not found:
+        if not found and not sitemap_stop.is_set():
             try:
                 parts = urllib.parse.urlsplit(site_base)
                 sm = f"{parts.scheme}://{parts.netloc}/sitemap.xml"
-                _crawl_sitemap(sm, found, site_base)
+                _crawl_sitemap(sm, found, site_base, visited)
             except Exception as ex:
                 LOG.debug("MacKID sitemap direct error: %s", str(ex)[:140])
         evs = {u for u in found if "/events/" in u}
@@ -2052,145 +3222,134 @@ def fetch_macaronikid_fxbg(days=60, user_agent=None):
         return status, (body or ""), headers_out
 
     def _find_event_links(html, page_url):
-        soup = BeautifulSoup(html, "html.parser")
-        links = set()
-        detail_pat = re.compile(r"^/events/[0-9a-f]{8,}(?:/[\w\-]*)?$", re.I)
-
-        a_links = 0
-        for a in soup.select("a[href*='/events/']"):
-            href = (a.get("href") or "").split("?", 1)[0].strip()
-            if not href:
-                continue
-            abs_url = urllib.parse.urljoin(page_url, href)
-            path = urllib.parse.urlsplit(abs_url).path
-            if detail_pat.match(path) and not path.rstrip("/").endswith("/events") and not path.rstrip("/").endswith(
-                "/events/calendar"
-            ):
-                links.add(abs_url)
-                a_links += 1
-
+        links = _mackid_event_links(html, page_url, cap=page_cap)
+        n_rx = len(links)
         ld_links = _extract_links_from_jsonld(html, page_url)
-        links |= ld_links
-
-        rx_links = _extract_links_by_regex(html, page_url)
-        links |= rx_links
+        links.update(ld_links)  # the regex set is fresh per call; grow it in place
 
         LOG.debug(
-            "MacKID links on %s -> anchors:%d jsonld:%d regex:%d total:%d",
+            "MacKID links on %s -> regex:%d jsonld:%d total:%d",
             page_url,
-            a_links,
+            n_rx,
             len(ld_links),
-            len(rx_links),
             len(links),
         )
         return links
 
+    def _list_page_links(start):
+        """GET + mine one list page on the worker pool; None when the GET failed."""
+        st, body, _ = _get(start)
+        if st in (200, 304) and body:
+            return _find_event_links(body, start)
+        LOG.debug("MacKID GET %s -> %s (len=%s)", start, st, len(body) if body else 0)
+        return None
+
     detail_urls = set()
     pages_visited = 0
     max_pages = 20
 
     LOG.debug("MacKID: using requests/sitemap fallback …")
-    for start in start_urls:
-        if pages_visited >= max_pages:
-            break
-        st, body, _ = _get(start)
-        if st == 200 and body:
-            new_links = _find_event_links(body, start)
-            detail_urls |= new_links
-            pages_visited += 1
-        else:
-            LOG.debug("MacKID GET %s -> %s (len=%s)", start, st, len(body) if body else 0)
-
-    if not detail_urls:
-        sm_links = _sitemap_event_links(base)
-        detail_urls |= sm_links
-
-    if os.getenv("FEEDS_DEBUG"):
+    workers = max(1, int(os.getenv("MAC_KID_WORKERS", "8")))
+    # List pages are independent as well: fetch and mine them on the pool, merge in order
+    starts = start_urls[:max_pages]
+    # Walk the sitemaps alongside the list pages so the fallback doesn't add its own
+    # round trips afterwards; if the list pages turn out to be enough it stops early
+    sitemap_stop = threading.Event()
+    sm_pool = ThreadPoolExecutor(max_workers=1)
+    sm_future = sm_pool.submit(_sitemap_event_links, base)
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        for new_links in ex.map(_list_page_links, starts):
+            if new_links is not None:
+                detail_urls.update(new_links)
+                pages_visited += 1
+
+    # Sitemaps are the slow path; only use them when the list pages came up short
+    if len(detail_urls) < int(os.getenv("MAC_KID_SITEMAP_MIN", "1")):
+        sm_links = sm_future.result()
+        detail_urls.update(sm_links)
+    else:
+        sitemap_stop.set()
+        sm_future.cancel()  # not started yet: never starts
+    # wait=True: a GET already in flight finishes (and frees its MacKID host slot) here,
+    # so no sitemap request outlives the fetcher or competes with the detail pool
+    sm_pool.shutdown(wait=True)
+    # Listing pages, not events: drop them before they cost a GET each
+    detail_urls = {u for u in detail_urls if not u.rstrip("/").endswith(("/events", "/events/calendar"))}
+
+    if debug:
         LOG.info("MacKID: pages_visited=%d detail_urls=%d", pages_visited, len(detail_urls))
-        for u in list(sorted(detail_urls))[:10]:
-            LOG.debug("   · detail: %s", u)
-
-    collected = []
+        if LOG.isEnabledFor(logging.DEBUG):
+            for u in sorted(detail_urls)[:10]:
+                LOG.debug("   · detail: %s", u)
 
-    for ev_url in sorted(detail_urls):
+    def _detail_events(ev_url):
+        """GET + parse one detail page; runs on the worker pool below."""
         st, body, _ = _get(ev_url)
-        if ev_url.rstrip("/").endswith("/events") or ev_url.rstrip("/").endswith("/events/calendar"):
-            continue
-        if st != 200 or not body:
+        if st not in (200, 304) or not body:
             LOG.debug("MacKID detail GET %s -> %s", ev_url, st)
-            continue
-        soup = BeautifulSoup(body, "html.parser")
+            return []
+        soup = BeautifulSoup(body, _HTML_PARSER, parse_only=_DETAIL_STRAIN)
+        # One C-level pass over the raw page decides whether anchors need ICS tests at all
+        found = _scan_mackid_detail(soup, want_ics=bool(_ICS_PAGE_RX.search(body)))
 
         # Prefer per-event ICS link (may be http(s) or data:)
-        ics_href = None
-        for a in soup.select("a[href]"):
-            href = (a.get("href") or "").strip()
-            txt = (a.get_text(" ", strip=True) or "").lower()
-            if (
-                href.lower().endswith(".ics")
-                or "apple calendar" in txt
-                or href.lower().startswith("data:text/calendar")
-            ):
-                ics_href = urllib.parse.urljoin(ev_url, href)
-                break
+        ics_href = _urljoin(ev_url, found["ics"]) if found["ics"] is not None else None
+
+        # Pull out the strings the HTML fallback needs, then free the tree and the page
+        # text before any further I/O (bs4 trees are reference cycles and would otherwise
+        # wait for a GC pass while this worker sits on the ICS request)
+        h = found["h1"] or found["title"]
+        title = h.get_text(" ", strip=True) if h else None
+        desc = found["desc"].get_text(" ", strip=True) if found["desc"] else None
+        loc = found["loc"].get_text(" ", strip=True) if found["loc"] else None
+        nodes = found["dates"]
+        date_text = None
+        if nodes:
+            date_text = " ".join(t for t in (n.get_text(" ", strip=True) for n in nodes) if t)
+        sm_tag = found["meta_start"]
+        em_tag = found["meta_end"]
+        sm = sm_tag.get("content").strip() if sm_tag and sm_tag.get("content") else ""
+        em = em_tag.get("content").strip() if em_tag and em_tag.get("content") else ""
+        soup.decompose()
+        del soup, body, nodes, h, sm_tag, em_tag
 
         if ics_href:
             try:
-                for e in fetch_ics(ics_href, user_agent=user_agent) or []:
+                evs = fetch_ics(ics_href, user_agent=user_agent) or []
+                for e in evs:
                     e["source"] = "macaronikid"
                     e.setdefault("link", ev_url)
-                    collected.append(e)
-                LOG.debug("MacKID ICS ok %s -> +%d", ics_href, len(collected))
-                continue
+                LOG.debug("MacKID ICS ok %s -> +%d", ics_href, len(evs))
+                return evs
             except Exception as ex:
                 LOG.debug("MacKID ICS fetch failed %s (%s) → fallback to HTML", ics_href, str(ex)[:140])
 
         # HTML fallback
-        title = None
-        desc = None
-        loc = None
-        date_text = None
-
-        h = soup.select_one("h1") or soup.select_one("[data-element='event-title']")
-        if h:
-            title = h.get_text(" ", strip=True)
-
-        d = soup.select_one("[data-element='event-description'], .article-content, .event-description")
-        if d:
-            desc = d.get_text(" ", strip=True)
-
-        l = soup.select_one("[data-element='event-location'], .event-location, .location, [itemprop='location']")
-        if l:
-            loc = l.get_text(" ", strip=True)
-
-        nodes = soup.select("[data-element='event-date'], .event-date, .event-time")
-        if nodes:
-            date_text = " ".join(n.get_text(" ", strip=True) for n in nodes if n.get_text(strip=True))
-
-        iso_start, iso_end = None, None
-        for t in soup.select("time[datetime]"):
-            dtv = (t.get("datetime") or "").strip()
-            if dtv:
+        # Each fallback below only runs while nothing earlier produced a date
+        if not date_text:
+            iso_start, iso_end = None, None
+            for dtv in found["times"]:
+                dtv = dtv.strip()
+                if not dtv:
+                    continue
                 if not iso_start:
                     iso_start = dtv
-                elif not iso_end:
+                else:
                     iso_end = dtv
-        if not date_text and (iso_start or iso_end):
-            date_text = f"{iso_start or ''} {iso_end or ''}".strip()
+                    break
+            if iso_start:
+                date_text = f"{iso_start} {iso_end or ''}".strip()
 
-        if not date_text:
-            sm_tag = soup.select_one("meta[itemprop='startDate'], meta[itemprop='startdate']")
-            em_tag = soup.select_one("meta[itemprop='endDate'], meta[itemprop='enddate']")
-            sm = sm_tag.get("content").strip() if sm_tag and sm_tag.get("content") else ""
-            em = em_tag.get("content").strip() if em_tag and em_tag.get("content") else ""
-            if sm or em:
-                date_text = f"{sm} {em}".strip()
+        if not date_text and (sm or em):
+            date_text = f"{sm} {em}".strip()
 
         if not date_text:
-            import json as _json
-            for s in soup.find_all("script", type="application/ld+json"):
+            for raw in found["jsonld"]:
+                # Only an "Event"/"Festival" @type can match below; skip parsing the rest
+                if '"Event"' not in raw and '"Festival"' not in raw:
+                    continue
                 try:
-                    dct = _json.loads(s.string)
+                    dct = _json_loads(raw)
                     cand = [dct] if isinstance(dct, dict) else (dct if isinstance(dct, list) else [])
                     for obj in cand:
                         if isinstance(obj, dict) and obj.get("@type") in ("Event", "Festival"):
@@ -2198,14 +3357,14 @@ def fetch_macaronikid_fxbg(days=60, user_agent=None):
                             em = obj.get("endDate") or obj.get("end_date") or ""
                             if sm or em:
                                 date_text = f"{sm} {em}".strip()
-                                raise StopIteration
-                except StopIteration:
-                    break
+                                break
                 except Exception:
                     pass
+                if date_text:
+                    break
 
         sdt, edt = parse_when(date_text or "", default_tz="America/New_York")
-        collected.append(
+        return [
             {
                 "title": title or "(untitled)",
                 "description": desc or "",
@@ -2215,7 +3374,18 @@ def fetch_macaronikid_fxbg(days=60, user_agent=None):
                 "location": loc,
                 "source": "macaronikid",
             }
-        )
+        ]
+
+    # Detail pages are independent: fetch/parse them concurrently (req_with_cache
+    # caps per-host concurrency). Work starts straight off the set; only the
+    # per-URL results are put in sorted order afterwards.
+    urls = list(detail_urls)
+    collected = []
+    if urls:
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            by_url = dict(zip(urls, ex.map(_detail_events, urls)))
+        for ev_url in sorted(by_url):
+            collected.extend(by_url[ev_url])
 
     LOG.info("MacKID collected events: %d", len(collected))
     return collected
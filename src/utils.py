@@ -1,7 +1,12 @@
-import hashlib, re, time, random
+import hashlib, re, time, random, functools
 from datetime import datetime, timedelta
 from dateutil import parser, tz
 
+# Whitespace runs collapsed before the parse_when cache lookup
+_WS_RE = re.compile(r"\s+")
+# "<start> - <end>" / "<start> to <end>" split
+_RANGE_SPLIT_RE = re.compile(r"\s*[–\-to]+\s*", re.IGNORECASE)
+
 WEEKDAY_WORDS = ["monday","tuesday","wednesday","thursday","friday","saturday","sunday"]
 
 def hash_event(title, start, location):
@@ -11,11 +16,20 @@ def hash_event(title, start, location):
 def parse_when(text, default_tz="America/New_York", fallback_hours=2):
     if not text:
         return None, None
-    text = re.sub(r"\s+", " ", str(text)).strip()
-    parts = re.split(r"\s*[–\-to]+\s*", text, maxsplit=1, flags=re.IGNORECASE)
+    text = _WS_RE.sub(" ", str(text)).strip()
+    # Fields missing from the text come from today at midnight; it's part of the
+    # cache key so a long-running process doesn't keep yesterday's date
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    return _parse_when_cached(text, default_tz, fallback_hours, today)
+
+# Feeds repeat the same date strings (recurring events, list + detail pages); the
+# results are immutable datetimes, so identical inputs can share one parse
+@functools.lru_cache(maxsize=2048)
+def _parse_when_cached(text, default_tz, fallback_hours, default):
+    parts = _RANGE_SPLIT_RE.split(text, maxsplit=1)
     local = tz.gettz(default_tz)
     try:
-        start = parser.parse(parts[0], fuzzy=True, default=datetime.now())
+        start = parser.parse(parts[0], fuzzy=True, default=default)
         if not start.tzinfo:
             start = start.replace(tzinfo=local)
         end = None